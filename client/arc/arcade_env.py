@@ -1,7 +1,10 @@
+import json
 import os
 from types import SimpleNamespace
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from arc_agi import Arcade, OperationMode
 from arcengine import GameAction as ArcGameAction, GameState as ArcGameState
 
@@ -25,6 +28,33 @@ def _to_namespace(value):
     return value
 
 
+def _retrying_session() -> requests.Session:
+    # Only failed connections and 429s are retried: every wrapper call is a
+    # POST that may already have changed the game if the server processed
+    # it, and a rate-limited request was rejected before that. Jitter keeps
+    # parallel sessions from retrying in lockstep.
+    session = requests.Session()
+    retries = Retry(
+        total=3,
+        read=0,
+        other=0,
+        backoff_factor=0.3,
+        backoff_jitter=0.3,
+        backoff_max=5,
+        status_forcelist=(429,),
+        allowed_methods=None,
+        raise_on_status=False,
+    )
+    adapter = HTTPAdapter(pool_connections=1, pool_maxsize=4, max_retries=retries)
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
+
+
+def _encode_json(payload: dict) -> bytes:
+    return json.dumps(payload, separators=(",", ":"), allow_nan=False).encode("utf-8")
+
+
 def _is_official_arc_url(url: str) -> bool:
     return "three.arcprize.org" in str(url or "").strip().lower()
 
@@ -41,31 +71,50 @@ class LocalArcEnvironmentWrapper:
     ) -> None:
         self.game_id = game_id
         self.base_url = base_url.rstrip("/")
-        self.headers = {"X-API-Key": api_key, "Accept": "application/json"}
-        self._session = http_session or requests.Session()
+        self.headers = {
+            "X-API-Key": api_key,
+            "Accept": "application/json",
+            "Content-Type": "application/json",
+        }
+        # Every endpoint is known up front, so URLs are built once rather
+        # than formatted on each step.
+        self._scorecard_url = f"{self.base_url}/api/scorecard/open"
+        self._cmd_urls = {
+            action: f"{self.base_url}/api/cmd/{action.name}" for action in GameAction
+        }
+        self._owns_session = http_session is None
+        self._session = http_session or _retrying_session()
         self.scorecard_id = self._open_scorecard()
         self.guid: str | None = None
 
-    def _request(self, method: str, path: str, payload: dict | None = None):
+    def _request(self, method: str, url: str, payload: dict | None = None):
+        # Encode the body ourselves: compact separators and bytes up front,
+        # instead of requests' spaced dump followed by a separate encode.
+        body = None if payload is None else _encode_json(payload)
         response = self._session.request(
             method,
-            f"{self.base_url}{path}",
-            json=payload,
+            url,
+            data=body,
             headers=self.headers,
             timeout=45,
         )
         response.raise_for_status()
         return response.json()
 
+    def close(self) -> None:
+        """Release pooled connections; injected sessions are left to their owner."""
+        if self._owns_session:
+            self._session.close()
+
     def _open_scorecard(self) -> str:
-        payload = self._request("POST", "/api/scorecard/open", {})
+        payload = self._request("POST", self._scorecard_url, {})
         return str(payload["card_id"])
 
     def reset(self):
         payload = {"card_id": self.scorecard_id, "game_id": self.game_id}
         if self.guid:
             payload["guid"] = self.guid
-        frame = self._request("POST", "/api/cmd/RESET", payload)
+        frame = self._request("POST", self._cmd_urls[GameAction.RESET], payload)
         self.guid = str(frame.get("guid") or self.guid or "")
         return _to_namespace(frame)
 
@@ -75,7 +124,7 @@ class LocalArcEnvironmentWrapper:
         payload = {"game_id": self.game_id, "guid": self.guid}
         if data:
             payload.update(data)
-        frame = self._request("POST", f"/api/cmd/{action.name}", payload)
+        frame = self._request("POST", self._cmd_urls[action], payload)
         return _to_namespace(frame)
 
 
@@ -120,6 +169,10 @@ class ArcadeEnv(BaseEnv):
             raise ValueError(f"Could not create ARC environment for {self.game_id}")
         self.session_id = self.game_id
 
+    def close(self) -> None:
+        if isinstance(self._env, LocalArcEnvironmentWrapper):
+            self._env.close()
+
     def _render_frame(self, frame_data) -> None:
         if self.renderer is None or frame_data is None:
             return
@@ -1,7 +1,8 @@
 ﻿import time
+from concurrent.futures import ThreadPoolExecutor
 from typing import Callable, Optional
 
-from client.runtime.runner import ActionExecutor, RuleReasoningLoop
+from client.runtime.runner import ActionExecutor, RuleReasoningLoop, emit
 from client.engine.architecture import EngineArchitecture
 from client.arc.base_env import BaseEnv
 from client.engine.llm_client import Config, LlmClient
@@ -42,6 +43,7 @@ def _make_loop(
         dashboard=dashboard,
         event_sink=event_sink,
         sleep_fn=time.sleep,
+        rate_limit_qps=agent.cfg.rate_limit_qps,
     )
 
 
@@ -65,3 +67,37 @@ def run_solving_loop(
 ) -> None:
     loop = _make_loop(env, agent, dashboard=dashboard, event_sink=event_sink)
     loop.run(max_steps=cfg.max_steps, game_id=cfg.game)
+
+
+def run_solving_sessions(
+    configs: list[Config],
+    make_env: Callable[[Config], BaseEnv],
+    llm_client: LlmClient,
+    event_sink: Optional[Callable[[str], None]] = None,
+    max_workers: int | None = None,
+) -> None:
+    """Run one solving loop per config at once over a shared LLM client.
+
+    Each session builds its own engine, so the configs should name different
+    games or rules directories. Envs are opened by the worker that runs the
+    session and closed when it ends; events are prefixed with the game id.
+    Identical requests from different sessions are answered by a single
+    completion when the client reuses responses.
+    """
+
+    def solve(cfg: Config) -> None:
+        def session_sink(message: str) -> None:
+            emit(f"[{cfg.game}] {message}", event_sink)
+
+        env = make_env(cfg)
+        try:
+            agent = Agent(cfg, llm_client, event_sink=session_sink)
+            run_solving_loop(cfg, env, agent, event_sink=session_sink)
+        finally:
+            close = getattr(env, "close", None)
+            if close is not None:
+                close()
+
+    workers = max_workers or len(configs)
+    with ThreadPoolExecutor(max_workers=max(1, workers)) as pool:
+        list(pool.map(solve, configs))
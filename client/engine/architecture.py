@@ -3,11 +3,14 @@ from __future__ import annotations
 from dataclasses import dataclass
 from pathlib import Path
 
+from client.engine.board_cache import SimilarBoardCache
+from client.engine.goal_manager import GoalManager
 from client.engine.induction import RuleInducer
 from client.engine.llm_client import Config
 from client.engine.memory import EngineMemory
 from client.engine.perception import Perception
 from client.engine.planner import Planner
+from client.engine.replay_cache import ReplayCache
 from client.engine.rulebook import Rulebook
 from client.engine.verifier import RuleVerifier
 
@@ -37,11 +40,21 @@ class EngineArchitecture:
         memory = EngineMemory(base_path / "timeline.jsonl")
         rulebook = Rulebook(base_path)
         verifier = RuleVerifier(memory)
+        threshold = config.similar_board_threshold
+        goal_manager = GoalManager(
+            board_cache=SimilarBoardCache(threshold) if threshold > 0 else None
+        )
         return cls(
             perceiver=Perception(),
             memory=memory,
             rulebook=rulebook,
             inducer=RuleInducer(llm_client, rulebook, verifier, event_sink=event_sink),
-            planner=Planner(rulebook=rulebook, memory=memory, llm_client=llm_client),
+            planner=Planner(
+                rulebook=rulebook,
+                memory=memory,
+                llm_client=llm_client,
+                goal_manager=goal_manager,
+                replay=ReplayCache(config.replay_path) if config.replay_path else None,
+            ),
             base_path=base_path,
         )
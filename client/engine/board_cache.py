@@ -0,0 +1,72 @@
+from __future__ import annotations
+
+from collections import OrderedDict
+from dataclasses import dataclass
+from operator import eq
+
+from client.arc.types import GameAction
+from client.engine.perception import Grid
+
+
+def grid_similarity(left: Grid, right: Grid) -> float:
+    """Fraction of equal cells between two same-shaped grids, else 0.0."""
+    if len(left) != len(right):
+        return 0.0
+    total = same = 0
+    for left_row, right_row in zip(left, right):
+        if len(left_row) != len(right_row):
+            return 0.0
+        total += len(left_row)
+        same += sum(map(eq, left_row, right_row))
+    return same / total if total else 1.0
+
+
+@dataclass(frozen=True)
+class CachedDecision:
+    grid: Grid
+    subgoal: str
+    plan: tuple[GameAction, ...]
+
+
+class SimilarBoardCache:
+    """Reuses subgoal/action answers for near-identical boards in the same context.
+
+    Context is matched exactly (offered actions, known rules, recent actions);
+    only the board is matched by cell similarity against ``threshold``.
+    """
+
+    def __init__(self, threshold: float = 0.97, max_entries: int = 256) -> None:
+        self.threshold = float(threshold)
+        self.max_entries = int(max_entries)
+        self._entries: OrderedDict[tuple, list[CachedDecision]] = OrderedDict()
+        self._size = 0
+
+    def lookup(self, grid: Grid, context: tuple) -> CachedDecision | None:
+        best: CachedDecision | None = None
+        best_score = self.threshold
+        for entry in self._entries.get(context, ()):
+            score = grid_similarity(grid, entry.grid)
+            if score >= best_score:
+                best, best_score = entry, score
+        if best is not None:
+            self._entries.move_to_end(context)
+        return best
+
+    def store(
+        self,
+        grid: Grid,
+        context: tuple,
+        subgoal: str,
+        plan: list[GameAction],
+    ) -> None:
+        entries = self._entries.setdefault(context, [])
+        entries.append(CachedDecision(grid, subgoal, tuple(plan)))
+        self._entries.move_to_end(context)
+        self._size += 1
+        while self._size > self.max_entries:
+            oldest = next(iter(self._entries))
+            group = self._entries[oldest]
+            group.pop(0)
+            self._size -= 1
+            if not group:
+                del self._entries[oldest]
@@ -3,9 +3,22 @@ from __future__ import annotations
 from dataclasses import dataclass
 
 from client.arc.types import GameAction
+from client.engine.board_cache import SimilarBoardCache
 from client.engine.perception import EngineState
 
 
+def _subgoal_system_prompt(game_id: str) -> str:
+    return (
+        "You guide an agent learning a grid puzzle by experiment. "
+        f"The game is '{game_id}'. "
+        "Verified rules could not produce a plan, so choose a small useful "
+        "subgoal and one next action to learn more or move toward solving. "
+        "Use only the available actions. "
+        "Do not predict the next board or dump a full state. "
+        'Output only JSON: {"subgoal": "one short sentence", "plan": ["ACTION1"]}'
+    )
+
+
 @dataclass(frozen=True)
 class Goal:
     """State target the planner tries to satisfy."""
@@ -17,9 +30,10 @@ class Goal:
 class GoalManager:
     """Owns the active goal/subgoal selected on behalf of the planner."""
 
-    def __init__(self) -> None:
+    def __init__(self, board_cache: SimilarBoardCache | None = None) -> None:
         self.game_goal: Goal | None = None
         self.subgoal: Goal | None = None
+        self.board_cache = board_cache
 
     def ensure_goal(self, _memory) -> Goal:
         if self.game_goal is None:
@@ -42,7 +56,23 @@ class GoalManager:
         recent_events: str,
         known_rules_text: str,
         image_data_urls: list[str] | None = None,
+        recent_actions: tuple[str, ...] = (),
+        plan_actions: list[GameAction] | None = None,
     ) -> tuple[Goal, list[GameAction]]:
+        valid_actions = plan_actions or actions
+        # Cached plans are replayed without parsing, so the offered actions
+        # they were checked against are part of the context.
+        context = (
+            tuple(action.name for action in actions),
+            tuple(action.name for action in valid_actions),
+            known_rules_text,
+            tuple(recent_actions),
+        )
+        if self.board_cache is not None:
+            cached = self.board_cache.lookup(current.grid, context)
+            if cached is not None:
+                return self.set_subgoal(cached.subgoal), list(cached.plan)
+
         system, prompt = self._subgoal_action_prompt(
             current=current,
             actions=actions,
@@ -55,9 +85,12 @@ class GoalManager:
             system,
             prompt,
             image_data_urls=image_data_urls,
+            validate=lambda answer: self._parse_action_plan(answer, valid_actions),
         )
-        plan = self._parse_action_plan(data, actions)
+        plan = self._parse_action_plan(data, valid_actions)
         goal = self.set_subgoal(str(data.get("subgoal", "")).strip())
+        if self.board_cache is not None:
+            self.board_cache.store(current.grid, context, goal.description, plan)
         return goal, plan
 
     def clear(self) -> None:
@@ -73,23 +106,17 @@ class GoalManager:
         known_rules_text: str,
         image_data_urls: list[str],
     ) -> tuple[str, str]:
-        system = (
-            "You guide an agent learning a grid puzzle by experiment. "
-            f"The game is '{current.game_id}'. "
-            "Verified rules could not produce a plan, so choose a small useful "
-            "subgoal and one next action to learn more or move toward solving. "
-            "Use only the available actions. "
-            "Do not predict the next board or dump a full state. "
-            'Output only JSON: {"subgoal": "one short sentence", "plan": ["ACTION1"]}'
-        )
+        system = _subgoal_system_prompt(current.game_id)
         image_note = ""
         if image_data_urls:
             image_note = "Rendered image context is attached.\n\n"
+        # Slow-changing sections first so consecutive calls share a long
+        # prefix for provider-side prompt caching; the board changes every step.
         prompt = (
-            f"Current board:\n{self._rows(current)}\n\n"
-            f"Available actions: {', '.join(action.name for action in actions)}\n\n"
             f"Known rule summaries:\n{known_rules_text or '- none'}\n\n"
+            f"Available actions: {', '.join(action.name for action in actions)}\n\n"
             f"Recent evidence:\n{recent_events or '- none'}\n\n"
+            f"Current board:\n{self._rows(current)}\n\n"
             f"{image_note}"
             "Choose the next subgoal and one-action plan. Output only JSON."
         )
@@ -101,12 +128,14 @@ class GoalManager:
         system: str,
         prompt: str,
         image_data_urls: list[str] | None = None,
+        validate=None,
     ) -> dict:
         return llm_client.call_json(
             system,
             prompt,
             image_data_urls=image_data_urls,
             purpose="subgoal/action",
+            validate=validate,
         )
 
     def _parse_action_plan(
@@ -120,16 +149,17 @@ class GoalManager:
         if not isinstance(raw_plan, list):
             raise ValueError(f"LLM exploration response has no action plan: {data}")
 
+        offered = {action.name: action for action in available_actions}
         plan: list[GameAction] = []
         for value in raw_plan:
             name = str(value).strip().upper()
-            if name not in GameAction.__members__:
-                raise ValueError(f"LLM returned unknown action: {value}")
-            action = GameAction[name]
-            if action not in available_actions:
+            action = offered.get(name)
+            if action is None:
+                if name not in GameAction.__members__:
+                    raise ValueError(f"LLM returned unknown action: {value}")
                 raise ValueError(
-                    f"LLM returned unavailable action {action.name}; "
-                    f"available: {', '.join(item.name for item in available_actions)}"
+                    f"LLM returned unavailable action {name}; "
+                    f"available: {', '.join(offered)}"
                 )
             plan.append(action)
 
@@ -1,10 +1,12 @@
 from __future__ import annotations
 
+import json
 from typing import Callable
 
 from client.engine.memory import EngineMemory, TransitionRecord
 from client.engine.rule_schema import candidate_rules_from_llm_json
 from client.engine.rulebook import Rulebook
+from client.engine.utils import extract_json
 from client.engine.verifier import RuleVerifier
 
 
@@ -29,6 +31,21 @@ Offsets are relative to the anchor cell. Use only integer cell values from the b
 """.strip()
 
 
+def _rule_system_prompt(game_name: str) -> str:
+    return (
+        "You are a physics engine reverse-engineer. "
+        f"You are observing a grid environment named '{game_name}'. "
+        "You observe action/state transitions and propose executable mechanical rules.\n\n"
+        f"{RULE_FORMAT}\n\n"
+        "Only propose rules directly supported by the event log. "
+        "Do not guess, do not duplicate known rules, and do not over-generalize from one direction. "
+        "Every rule must include a concise natural-language summary and cite the "
+        "transition ids that support it.\n\n"
+        'Output only JSON: {"rules": [<rule objects>]}\n'
+        'If no rule is supported, output: {"rules": []}'
+    )
+
+
 class RuleInducer:
     """Asks the LLM for executable logical rules, then stores their evidence."""
 
@@ -120,10 +137,6 @@ class RuleInducer:
                 purpose="rule creation",
             )
 
-        import json
-
-        from client.engine.utils import extract_json
-
         response = self.llm_client._call(
             system,
             prompt,
@@ -156,18 +169,7 @@ class RuleInducer:
         focus_prompt: str,
         game_name: str = "Unknown",
     ) -> tuple[str, str]:
-        system = (
-            "You are a physics engine reverse-engineer. "
-            f"You are observing a grid environment named '{game_name}'. "
-            "You observe action/state transitions and propose executable mechanical rules.\n\n"
-            f"{RULE_FORMAT}\n\n"
-            "Only propose rules directly supported by the event log. "
-            "Do not guess, do not duplicate known rules, and do not over-generalize from one direction. "
-            "Every rule must include a concise natural-language summary and cite the "
-            "transition ids that support it.\n\n"
-            'Output only JSON: {"rules": [<rule objects>]}\n'
-            'If no rule is supported, output: {"rules": []}'
-        )
+        system = _rule_system_prompt(game_name)
         prompt = (
             "Known natural-language rules:\n"
             f"{known_rules_text}\n\n"
@@ -0,0 +1,94 @@
+"""Persistent exact-match cache for LLM responses."""
+
+from __future__ import annotations
+
+import hashlib
+import re
+import sqlite3
+import threading
+import time
+from pathlib import Path
+
+
+# Timeline and rule ids (T000012, S000013, G000004) are the only parts of an
+# otherwise identical prompt that change from step to step.
+_RECORD_ID = re.compile(r"\b[TSG]\d{6}\b")
+_SLOT = re.compile(r"<id:(\d+)>")
+
+
+def id_slots(*texts: str) -> list[str]:
+    """Distinct record ids in ``texts``, in order of first appearance."""
+    slots: dict[str, None] = {}
+    for text in texts:
+        for match in _RECORD_ID.finditer(text):
+            slots.setdefault(match.group(0), None)
+    return list(slots)
+
+
+def to_template(text: str, slots: list[str]) -> str:
+    """Replace known record ids with positional ``<id:N>`` slots."""
+    index = {record_id: position for position, record_id in enumerate(slots)}
+    return _RECORD_ID.sub(
+        lambda match: (
+            f"<id:{index[match.group(0)]}>"
+            if match.group(0) in index
+            else match.group(0)
+        ),
+        text,
+    )
+
+
+def from_template(text: str, slots: list[str]) -> str:
+    """Fill ``<id:N>`` slots back in with this request's record ids."""
+    return _SLOT.sub(
+        lambda match: (
+            slots[int(match.group(1))]
+            if int(match.group(1)) < len(slots)
+            else match.group(0)
+        ),
+        text,
+    )
+
+
+class LlmResponseCache:
+    """SQLite-backed store of model responses keyed by the full request.
+
+    Callers key on the request with record ids templated out (see
+    ``to_template``) so the same evidence under new ids still hits.
+    """
+
+    def __init__(self, path: str | Path) -> None:
+        self.path = str(path)
+        if self.path != ":memory:":
+            Path(self.path).parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(self.path, check_same_thread=False)
+        # One connection is shared by every session using the client.
+        self._lock = threading.Lock()
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS cache ("
+            "key TEXT PRIMARY KEY, response TEXT NOT NULL, ts INTEGER NOT NULL)"
+        )
+        self._conn.commit()
+
+    @staticmethod
+    def key(*parts: str) -> str:
+        return hashlib.sha256("\0".join(parts).encode("utf-8")).hexdigest()
+
+    def get(self, key: str) -> str | None:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT response FROM cache WHERE key = ?", (key,)
+            ).fetchone()
+        return None if row is None else str(row[0])
+
+    def set(self, key: str, response: str) -> None:
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO cache (key, response, ts) VALUES (?, ?, ?)",
+                (key, response, int(time.time())),
+            )
+            self._conn.commit()
+
+    def close(self) -> None:
+        self._conn.close()
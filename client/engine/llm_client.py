@@ -1,6 +1,10 @@
 import os
 import json
+import logging
+import threading
 import time
+from collections import OrderedDict
+from concurrent.futures import Future
 from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Callable, Optional
@@ -8,10 +12,59 @@ from typing import Callable, Optional
 from openai import OpenAI
 from dotenv import load_dotenv
 
-from client.engine.utils import extract_json
+from client.arc.types import GameAction
+from client.engine.llm_cache import (
+    LlmResponseCache,
+    from_template,
+    id_slots,
+    to_template,
+)
+from client.engine.utils import compact_board_rows, extract_json, json_object_end
 
 load_dotenv()
 
+log = logging.getLogger(__name__)
+
+
+# JSON schemas used for structured outputs, keyed by call purpose. Only the
+# subgoal/action answer has a fixed shape; rule induction stays json_object.
+RESPONSE_SCHEMAS: dict[str, dict] = {
+    "subgoal/action": {
+        "name": "subgoal_action",
+        "strict": True,
+        "schema": {
+            "type": "object",
+            "properties": {
+                "subgoal": {"type": "string"},
+                "plan": {
+                    "type": "array",
+                    "items": {
+                        "type": "string",
+                        "enum": [
+                            action.name
+                            for action in GameAction
+                            if action is not GameAction.RESET
+                        ],
+                    },
+                },
+            },
+            "required": ["subgoal", "plan"],
+            "additionalProperties": False,
+        },
+    },
+}
+
+
+def _json_object(text: str) -> dict:
+    """Parse a JSON-mode answer, which must be a single object."""
+    try:
+        data = json.loads(extract_json(text))
+    except json.JSONDecodeError as e:
+        raise ValueError(f"LLM returned invalid JSON: {e}") from e
+    if not isinstance(data, dict):
+        raise ValueError("LLM JSON response must be an object")
+    return data
+
 
 @dataclass
 class Config:
@@ -25,13 +78,50 @@ class Config:
     game: str = "ps_sokoban_basic-v1"
     mode: str = "learn"
     max_steps: int = 20
-    show_legend: bool = False
     openrouter_api_key: str = field(
         default_factory=lambda: os.getenv("OPENROUTER_API_KEY", "")
     )
     rules_dir: str = field(
         default_factory=lambda: str(Path(__file__).resolve().parents[1] / "rules")
     )
+    # Empty disables the on-disk response cache; ":memory:" keeps it per-process.
+    cache_path: str = ""
+    # Reuse a subgoal/action answer when the board matches a previously asked
+    # board on at least this fraction of cells. 0 disables the lookup.
+    similar_board_threshold: float = 0.0
+    # SQLite file of actions that solved each (game, level, board); reruns
+    # replay them without planning or LLM calls. Empty disables replay.
+    replay_path: str = ""
+    # Stream completions; JSON-mode calls stop reading once the object closes.
+    stream_responses: bool = False
+    # Per-purpose model overrides, e.g. {"subgoal/action": "openai/gpt-5-nano"}.
+    # Purposes without an entry use `model`.
+    purpose_models: dict[str, str] = field(default_factory=dict)
+    # Per-purpose completion token caps sent as max_tokens. The subgoal/action
+    # answer is a one-line JSON object, so a few hundred tokens is plenty.
+    purpose_max_tokens: dict[str, int] = field(default_factory=dict)
+    # Sampling temperature; None leaves the provider default. At 0 the same
+    # request always gets the same answer, so repeats are served from memory.
+    temperature: float | None = None
+    # Answers kept in process for reuse, least recently used evicted first.
+    memo_max_entries: int = 4096
+    # Env actions per second allowed by the runner's token bucket; 0 disables
+    # pacing entirely.
+    rate_limit_qps: float = 1.0
+    # Mark the system prompt as a cacheable prefix (OpenRouter cache_control).
+    # Anthropic and Gemini models need this explicit breakpoint; providers
+    # with automatic prefix caching ignore it.
+    prompt_caching: bool = False
+    # Send single-digit boards without cell separators ("2 0 1" -> "201"),
+    # roughly halving board tokens. Boards with larger values are unchanged.
+    compact_boards: bool = False
+    # Ask for a response_format json_schema on purposes listed in
+    # RESPONSE_SCHEMAS, so the model can only emit valid action names.
+    structured_outputs: bool = False
+    # Retries for transient OpenRouter failures (connection errors, timeouts,
+    # 408/409/429/5xx). The SDK backs off exponentially with jitter and
+    # honours Retry-After; other errors are raised immediately.
+    llm_max_retries: int = 4
 
     def __post_init__(self) -> None:
         """Validate required environment configuration."""
@@ -53,10 +143,19 @@ class LlmClient:
         self.client = OpenAI(
             base_url="https://openrouter.ai/api/v1",
             api_key=config.openrouter_api_key,
+            max_retries=config.llm_max_retries,
         )
+        self.cache = LlmResponseCache(config.cache_path) if config.cache_path else None
+        # In-process LRU layer in front of the SQLite cache, keyed the same way.
+        self._memo: OrderedDict[str, str] = OrderedDict()
+        self._kwargs_by_purpose: dict[tuple[bool, str], dict] = {}
+        # Reusable requests currently being answered, so concurrent sessions
+        # asking the same thing wait on one completion instead of sending N.
+        self._pending: dict[str, Future] = {}
+        self._lock = threading.Lock()
 
-    def _log(self, message: str) -> None:
-        print(message)
+    def _log(self, message: str, level: int = logging.INFO) -> None:
+        log.log(level, message)
         if self.event_sink is not None:
             self.event_sink(message)
 
@@ -67,8 +166,17 @@ class LlmClient:
         json_mode: bool = False,
         image_data_urls: list[str] | None = None,
         purpose: str = "",
+        validate: Callable[[str], object] | None = None,
     ) -> str:
-        """Call the configured OpenRouter model and return plain text output."""
+        """Call the configured OpenRouter model and return plain text output.
+
+        ``validate`` may raise to reject a fresh answer; rejected answers are
+        never cached, so the next identical request asks the model again.
+        """
+        if self.cfg.compact_boards:
+            compacted = compact_board_rows(prompt)
+            if compacted != prompt:
+                prompt = f"{compacted}\n\nBoards are written one digit per cell."
         user_content: str | list[dict] = prompt
         images = [url for url in image_data_urls or [] if str(url).strip()]
         if images:
@@ -79,31 +187,177 @@ class LlmClient:
                     for url in images
                 ],
             ]
+        system_content: str | list[dict] = system
+        if self.cfg.prompt_caching:
+            system_content = [
+                {"type": "text", "text": system, "cache_control": {"type": "ephemeral"}}
+            ]
         messages = [
-            {"role": "system", "content": system},
+            {"role": "system", "content": system_content},
             {"role": "user", "content": user_content},
         ]
 
-        kwargs: dict = {"timeout": 45}
+        kwargs = self._request_kwargs(json_mode, purpose)
+        max_tokens = self.cfg.purpose_max_tokens.get(purpose)
+        temperature = self.cfg.temperature
+
+        model = self._openrouter_model(purpose)
+        purpose_text = f" for {purpose}" if purpose else ""
+        if self.cache is None and temperature != 0:
+            return self._complete(model, messages, json_mode, kwargs, purpose_text)
+        slots = id_slots(system, prompt)
+        cache_key = LlmResponseCache.key(
+            model,
+            self.cfg.reasoning_effort,
+            "json" if json_mode else "text",
+            str(max_tokens or ""),
+            "" if temperature is None else str(float(temperature)),
+            to_template(system, slots),
+            to_template(prompt, slots),
+            *images,
+        )
+        with self._lock:
+            cached = self._recall(cache_key)
+        if cached is None and self.cache is not None:
+            cached = self.cache.get(cache_key)
+        with self._lock:
+            if cached is None:
+                # Another session may have finished the same request meanwhile.
+                cached = self._recall(cache_key)
+            else:
+                self._remember(cache_key, cached)
+            pending = self._pending.get(cache_key)
+            owner = cached is None and pending is None
+            if owner:
+                pending = self._pending[cache_key] = Future()
+        if cached is not None:
+            self._log(f"[{model}] Cache hit{purpose_text}")
+            return from_template(cached, slots)
+        if not owner:
+            self._log(f"[{model}] Waiting on identical request{purpose_text}")
+            return from_template(pending.result(), slots)
+        try:
+            content = self._complete(model, messages, json_mode, kwargs, purpose_text)
+            if validate is not None:
+                validate(content)
+            template = to_template(content, slots)
+            with self._lock:
+                self._remember(cache_key, template)
+            if self.cache is not None:
+                self.cache.set(cache_key, template)
+            pending.set_result(template)
+        except BaseException as e:
+            pending.set_exception(e)
+            raise
+        finally:
+            with self._lock:
+                del self._pending[cache_key]
+        return content
+
+    def _recall(self, key: str) -> str | None:
+        """In-process answer for ``key``; the caller holds ``_lock``."""
+        value = self._memo.get(key)
+        if value is not None:
+            self._memo.move_to_end(key)
+        return value
+
+    def _remember(self, key: str, value: str) -> None:
+        """Store an answer, evicting the least recently used past the cap."""
+        self._memo[key] = value
+        self._memo.move_to_end(key)
+        while len(self._memo) > max(0, self.cfg.memo_max_entries):
+            self._memo.popitem(last=False)
+
+    def _complete(
+        self,
+        model: str,
+        messages: list[dict],
+        json_mode: bool,
+        kwargs: dict,
+        purpose_text: str,
+    ) -> str:
+        """Send one completion request and return its stripped text."""
+        self._log(f"Asking {model}{purpose_text}...")
+        # Only time the request when someone will see the latency.
+        timed = self.event_sink is not None or log.isEnabledFor(logging.DEBUG)
+        start = time.perf_counter() if timed else 0.0
+        if self.cfg.stream_responses:
+            content = self._stream_content(model, messages, json_mode, kwargs)
+        else:
+            response = self.client.chat.completions.create(
+                model=model,
+                messages=messages,
+                **kwargs,
+            )
+            content = response.choices[0].message.content
+        if timed:
+            self._log(
+                f"[{model}] Response time: {time.perf_counter() - start:.1f}s",
+                logging.DEBUG,
+            )
+        if not content or not content.strip():
+            raise ValueError("LLM returned empty content")
+        return content.strip()
+
+    def _request_kwargs(self, json_mode: bool, purpose: str) -> dict:
+        """Completion options for a purpose, built once and reused per call."""
+        key = (json_mode, purpose)
+        kwargs = self._kwargs_by_purpose.get(key)
+        if kwargs is not None:
+            return kwargs
+        kwargs = {"timeout": 45}
         if json_mode:
-            kwargs["response_format"] = {"type": "json_object"}
+            schema = None
+            if self.cfg.structured_outputs:
+                schema = RESPONSE_SCHEMAS.get(purpose)
+            kwargs["response_format"] = (
+                {"type": "json_schema", "json_schema": schema}
+                if schema is not None
+                else {"type": "json_object"}
+            )
         if self.cfg.reasoning_effort:
             kwargs["reasoning_effort"] = self.cfg.reasoning_effort
+        max_tokens = self.cfg.purpose_max_tokens.get(purpose)
+        if max_tokens:
+            kwargs["max_tokens"] = int(max_tokens)
+        if self.cfg.temperature is not None:
+            kwargs["temperature"] = float(self.cfg.temperature)
+        self._kwargs_by_purpose[key] = kwargs
+        return kwargs
 
-        model = self._openrouter_model()
-        purpose_text = f" for {purpose}" if purpose else ""
-        self._log(f"Asking {model}{purpose_text}...")
-        start = time.time()
-        response = self.client.chat.completions.create(
+    def _stream_content(
+        self,
+        model: str,
+        messages: list[dict],
+        json_mode: bool,
+        kwargs: dict,
+    ) -> str:
+        """Accumulate streamed deltas, closing early once a JSON object is complete."""
+        stream = self.client.chat.completions.create(
             model=model,
             messages=messages,
+            stream=True,
             **kwargs,
         )
-        self._log(f"[{model}] Response time: {time.time() - start:.1f}s")
-        content = response.choices[0].message.content
-        if not content or not content.strip():
-            raise ValueError("LLM returned empty content")
-        return content.strip()
+        parts: list[str] = []
+        try:
+            for chunk in stream:
+                if not chunk.choices:
+                    continue
+                delta = chunk.choices[0].delta.content
+                if not delta:
+                    continue
+                parts.append(delta)
+                if json_mode and "}" in delta:
+                    text = "".join(parts)
+                    end = json_object_end(text)
+                    if end is not None:
+                        # Drop any opening fence too; its closing half is
+                        # never read.
+                        return text[text.index("{"):end]
+        finally:
+            stream.close()
+        return "".join(parts)
 
     def call_text(
         self,
@@ -126,24 +380,26 @@ class LlmClient:
         prompt: str,
         image_data_urls: list[str] | None = None,
         purpose: str = "",
+        validate: Callable[[dict], object] | None = None,
     ) -> dict:
+        def check(text: str) -> None:
+            data = _json_object(text)
+            if validate is not None:
+                validate(data)
+
         response = self._call(
             system,
             prompt,
             json_mode=True,
             image_data_urls=image_data_urls,
             purpose=purpose,
+            validate=check,
         )
-        try:
-            data = json.loads(extract_json(response))
-        except json.JSONDecodeError as e:
-            raise ValueError(f"LLM returned invalid JSON: {e}") from e
-        if not isinstance(data, dict):
-            raise ValueError("LLM JSON response must be an object")
-        return data
-
-    def _openrouter_model(self) -> str:
+        return _json_object(response)
+
+    def _openrouter_model(self, purpose: str = "") -> str:
         """Return the bare OpenRouter model ID (strip litellm-style prefix)."""
-        if self.cfg.model.startswith("openrouter/"):
-            return self.cfg.model[len("openrouter/"):]
-        return self.cfg.model
+        model = self.cfg.purpose_models.get(purpose) or self.cfg.model
+        if model.startswith("openrouter/"):
+            return model[len("openrouter/"):]
+        return model
@@ -1,15 +1,15 @@
 ﻿from __future__ import annotations
 
 import json
-from dataclasses import dataclass
+from dataclasses import dataclass, replace
 from pathlib import Path
 from typing import Any
 
-from client.engine.perception import EngineState
+from client.engine.perception import EngineState, Grid
 from client.arc.types import GameAction
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class StateNode:
     id: str
     state: EngineState
@@ -23,7 +23,7 @@ class StateNode:
         return {"kind": self.kind, "id": self.id, "state": self.state.to_data()}
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ActionEdge:
     id: str
     action: GameAction
@@ -53,7 +53,7 @@ class ActionEdge:
 TimelineItem = StateNode | ActionEdge
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class TransitionRecord:
     """Derived state/action/state evidence view over the canonical timeline."""
 
@@ -77,15 +77,24 @@ class EngineMemory:
     def __init__(self, path: str | Path | object, load_existing: bool = True) -> None:
         self.path = Path(getattr(path, "path", path))
         self.timeline: list[TimelineItem] = []
+        # Incremental indexes over the timeline so appends and lookups do not
+        # rescan the whole history on every step.
+        self._states: list[StateNode] = []
         self._transitions: list[TransitionRecord] = []
+        self._transitions_by_id: dict[str, TransitionRecord] = {}
+        self._noop_actions: dict[EngineState, set[GameAction]] = {}
+        self._action_counts: dict[tuple[EngineState, GameAction], int] = {}
+        self._global_action_counts: dict[GameAction, int] = {}
+        # Repeated boards share one grid tuple instead of one copy per node.
+        self._grid_pool: dict[Grid, Grid] = {}
         if load_existing:
             self._load()
 
     def append_initial_state(self, state: EngineState) -> StateNode:
         if self.timeline:
             return self._state_nodes()[-1]
-        node = StateNode(id=self._new_state_id(), state=state)
-        self.timeline.append(node)
+        node = StateNode(id=self._new_state_id(), state=self._interned(state))
+        self._append_state_node(node)
         self._append_jsonl(node.to_data())
         return node
 
@@ -95,8 +104,8 @@ class EngineMemory:
         current = self._state_nodes()[-1]
         if current.state == state and current.state.image == state.image:
             return current
-        node = StateNode(id=self._new_state_id(), state=state)
-        self.timeline.append(node)
+        node = StateNode(id=self._new_state_id(), state=self._interned(state))
+        self._append_state_node(node)
         self._append_jsonl(node.to_data())
         return node
 
@@ -107,18 +116,20 @@ class EngineMemory:
             raise ValueError("Cannot append action result before initial state")
 
         before_node = self._state_nodes()[-1]
-        after_node = StateNode(id=self._new_state_id(), state=after_state)
+        after_node = StateNode(
+            id=self._new_state_id(), state=self._interned(after_state)
+        )
         edge = ActionEdge(
             id=self._new_action_id(),
             action=action,
             before_id=before_node.id,
             after_id=after_node.id,
         )
-        self.timeline.extend([edge, after_node])
-        self._append_jsonl(edge.to_data())
-        self._append_jsonl(after_node.to_data())
+        self.timeline.append(edge)
+        self._append_state_node(after_node)
+        self._append_jsonl(edge.to_data(), after_node.to_data())
         record = self._record_from_nodes(before_node, edge, after_node)
-        self._transitions.append(record)
+        self._index_transition(record)
         return record
 
     def record_transition(
@@ -127,8 +138,8 @@ class EngineMemory:
         if not self.timeline:
             self.append_initial_state(before)
         elif self.current_state() != before:
-            node = StateNode(id=self._new_state_id(), state=before)
-            self.timeline.append(node)
+            node = StateNode(id=self._new_state_id(), state=self._interned(before))
+            self._append_state_node(node)
             self._append_jsonl(node.to_data())
         return self.append_action_result(action, after)
 
@@ -147,11 +158,28 @@ class EngineMemory:
     def recent_transitions(self, limit: int) -> list[TransitionRecord]:
         return self._transitions[-max(0, int(limit)) :]
 
+    def latest_level_run(self) -> list[TransitionRecord]:
+        """Trailing unbroken chain of transitions within the latest level.
+
+        The chain stops at a reset (where a transition does not start from the
+        previous one's result) or at the start of the level.
+        """
+        if not self._transitions:
+            return []
+        level = self._transitions[-1].before.levels_completed
+        start = len(self._transitions) - 1
+        while start > 0:
+            previous = self._transitions[start - 1]
+            if (
+                previous.after != self._transitions[start].before
+                or previous.before.levels_completed != level
+            ):
+                break
+            start -= 1
+        return self._transitions[start:]
+
     def transition_by_id(self, record_id: str) -> TransitionRecord | None:
-        return next(
-            (record for record in self._transitions if record.id == record_id),
-            None,
-        )
+        return self._transitions_by_id.get(record_id)
 
     def latest_visual_context(self) -> tuple[str, list[str]]:
         if not self._transitions:
@@ -193,15 +221,15 @@ class EngineMemory:
             )
         return "\n\n".join(lines)
 
+    def noop_actions(self, state: EngineState) -> set[GameAction]:
+        """Actions already observed to leave this exact state unchanged."""
+        return set(self._noop_actions.get(state, ()))
+
     def action_count(self, before: EngineState, action: GameAction) -> int:
-        return sum(
-            1
-            for record in self._transitions
-            if record.before == before and record.action == action
-        )
+        return self._action_counts.get((before, action), 0)
 
     def global_action_count(self, action: GameAction) -> int:
-        return sum(1 for record in self._transitions if record.action == action)
+        return self._global_action_counts.get(action, 0)
 
     def _load(self) -> None:
         if not self.path.exists():
@@ -212,18 +240,21 @@ class EngineMemory:
             data = json.loads(line)
             kind = data.get("kind")
             if kind == "state":
-                self.timeline.append(StateNode.from_data(data))
+                node = StateNode.from_data(data)
+                self._append_state_node(
+                    replace(node, state=self._interned(node.state))
+                )
             elif kind == "action":
                 self.timeline.append(ActionEdge.from_data(data))
         self._rebuild_transitions()
 
-    def _append_jsonl(self, data: dict[str, Any]) -> None:
+    def _append_jsonl(self, *records: dict[str, Any]) -> None:
         self.path.parent.mkdir(parents=True, exist_ok=True)
         with self.path.open("a", encoding="utf-8") as file:
-            file.write(json.dumps(data) + "\n")
+            file.write("".join(json.dumps(data) + "\n" for data in records))
 
     def _rebuild_transitions(self) -> None:
-        nodes = {item.id: item for item in self.timeline if isinstance(item, StateNode)}
+        nodes = {node.id: node for node in self._states}
         records = []
         for item in self.timeline:
             if not isinstance(item, ActionEdge):
@@ -233,7 +264,13 @@ class EngineMemory:
             if before is None or after is None:
                 continue
             records.append(self._record_from_nodes(before, item, after))
-        self._transitions = records
+        self._transitions = []
+        self._transitions_by_id = {}
+        self._noop_actions = {}
+        self._action_counts = {}
+        self._global_action_counts = {}
+        for record in records:
+            self._index_transition(record)
 
     def _record_from_nodes(
         self, before: StateNode, edge: ActionEdge, after: StateNode
@@ -245,8 +282,27 @@ class EngineMemory:
             after=after.state,
         )
 
+    def _index_transition(self, record: TransitionRecord) -> None:
+        self._transitions.append(record)
+        self._transitions_by_id[record.id] = record
+        tried = (record.before, record.action)
+        self._action_counts[tried] = self._action_counts.get(tried, 0) + 1
+        self._global_action_counts[record.action] = (
+            self._global_action_counts.get(record.action, 0) + 1
+        )
+        if record.before == record.after:
+            self._noop_actions.setdefault(record.before, set()).add(record.action)
+
+    def _interned(self, state: EngineState) -> EngineState:
+        grid = self._grid_pool.setdefault(state.grid, state.grid)
+        return state if grid is state.grid else replace(state, grid=grid)
+
+    def _append_state_node(self, node: StateNode) -> None:
+        self.timeline.append(node)
+        self._states.append(node)
+
     def _state_nodes(self) -> list[StateNode]:
-        return [item for item in self.timeline if isinstance(item, StateNode)]
+        return self._states
 
     def _new_state_id(self) -> str:
         return f"S{len(self._state_nodes()) + 1:06d}"
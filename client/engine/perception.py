@@ -1,6 +1,7 @@
 ﻿from __future__ import annotations
 
 from dataclasses import dataclass, field
+from functools import cached_property
 from typing import Any
 
 from client.arc.types import FrameData, GameAction, GameState, RenderedFrame
@@ -78,6 +79,30 @@ class EngineState:
             ),
         )
 
+    @cached_property
+    def fingerprint(self) -> int:
+        """Hash of the compared fields, computed once per state."""
+        return hash(
+            (self.grid, self.state, self.levels_completed, self.win_levels, self.game_id)
+        )
+
+    def __hash__(self) -> int:
+        return self.fingerprint
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, EngineState):
+            return NotImplemented
+        if self is other:
+            return True
+        return (
+            self.fingerprint == other.fingerprint
+            and self.grid == other.grid
+            and self.state == other.state
+            and self.levels_completed == other.levels_completed
+            and self.win_levels == other.win_levels
+            and self.game_id == other.game_id
+        )
+
     def to_data(self) -> dict[str, Any]:
         return {
             "grid": [list(row) for row in self.grid],
@@ -95,7 +120,13 @@ class EngineState:
         )
 
     def rows(self) -> list[str]:
-        return [" ".join(str(value) for value in row) for row in self.grid]
+        return list(self._row_text)
+
+    @cached_property
+    def _row_text(self) -> tuple[str, ...]:
+        # Prompts render the same state several times (memory context, goal
+        # and induction prompts); format each state's rows only once.
+        return tuple(" ".join([str(value) for value in row]) for row in self.grid)
 
     def cell(self, x: int, y: int) -> int | None:
         if y < 0 or y >= len(self.grid):
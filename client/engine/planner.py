@@ -6,6 +6,7 @@ from dataclasses import dataclass
 from client.engine.goal_manager import Goal, GoalManager
 from client.engine.memory import EngineMemory
 from client.engine.perception import EngineState
+from client.engine.replay_cache import ReplayCache
 from client.engine.rulebook import Rulebook
 from client.arc.types import FrameData, GameAction
 
@@ -29,6 +30,14 @@ class PlanDecision:
     exploratory: bool = False
 
 
+@dataclass(frozen=True)
+class SpeculativePlan:
+    state: EngineState
+    actions: tuple[GameAction, ...]
+    rules_revision: int
+    plan: list[GameAction] | None
+
+
 @dataclass(frozen=True)
 class ActivePlan:
     goal: Goal
@@ -59,6 +68,7 @@ class Planner:
         goal_manager: GoalManager | None = None,
         max_depth: int = 20,
         node_limit: int = 200,
+        replay: ReplayCache | None = None,
     ) -> None:
         if rulebook is None:
             raise ValueError("Planner requires a rulebook")
@@ -68,8 +78,10 @@ class Planner:
         self.goal_manager = goal_manager or GoalManager()
         self.max_depth = max_depth
         self.node_limit = node_limit
+        self.replay = replay
         self.game_goal: Goal | None = None
         self.active_plan: ActivePlan | None = None
+        self._speculative: SpeculativePlan | None = None
 
     def choose_action(
         self,
@@ -87,6 +99,10 @@ class Planner:
         if continued is not None:
             return continued
 
+        replayed = self.replay.action_for(current) if self.replay else None
+        if replayed in actions:
+            return PlanDecision(replayed, "replay", [replayed])
+
         if self.game_goal is None:
             self.game_goal = self.goal_manager.ensure_goal(memory)
 
@@ -107,9 +123,40 @@ class Planner:
     def clear_llm_plan(self) -> None:
         self.active_plan = None
 
+    def remember_solved_level(self) -> int:
+        """Store the run that just finished a level for replay on reruns."""
+        if self.replay is None or self.memory is None:
+            return 0
+        return self.replay.record_solution(self.memory.latest_level_run())
+
+    def speculate(self, current: EngineState, predicted: EngineState) -> None:
+        """Search from the board the rules expect next while the step runs.
+
+        The result is only used if the real next board, the offered actions
+        and the rules all still match when the planner is next asked.
+        """
+        active = self.active_plan
+        if active is not None and active.next_action() is not None:
+            return
+        actions = self.available_actions(current)
+        self._speculative = SpeculativePlan(
+            state=predicted,
+            actions=tuple(actions),
+            rules_revision=self.rulebook.revision,
+            plan=self.plan_to_win(predicted, actions),
+        )
+
     def plan_to_goal(
         self, current: EngineState, actions: list[GameAction]
     ) -> list[GameAction] | None:
+        speculative, self._speculative = self._speculative, None
+        if (
+            speculative is not None
+            and speculative.state == current
+            and speculative.actions == tuple(actions)
+            and speculative.rules_revision == self.rulebook.revision
+        ):
+            return speculative.plan
         return self.plan_to_win(current, actions)
 
     def plan_to_win(
@@ -157,6 +204,27 @@ class Planner:
         actions: list[GameAction],
         frame_data: FrameData | None = None,
     ) -> PlanDecision:
+        offered = actions
+        untried = self._untried_actions(current, actions)
+        if len(untried) == 1 and len(actions) > 1:
+            # Every other action is known to leave this board unchanged, so
+            # there is nothing for the LLM to choose between.
+            action = untried[0]
+            goal = self.goal_manager.set_subgoal(
+                f"try {action.name}, the only action not yet seen to do nothing here"
+            )
+            return PlanDecision(
+                action,
+                "untried_action",
+                [action],
+                subgoal=goal.description,
+                exploratory=True,
+            )
+        elif untried:
+            # Only the prompt is narrowed; later plan steps run on other
+            # boards, where a no-op action here may well do something.
+            actions = untried
+
         if self.llm_client is None:
             raise RuntimeError(
                 "Planner needs an LLM client when no rule plan exists"
@@ -170,6 +238,8 @@ class Planner:
             recent_events=recent_events,
             known_rules_text=self.rulebook.known_rules_text(),
             image_data_urls=image_data_urls,
+            recent_actions=self._recent_actions(),
+            plan_actions=offered,
         )
         self.active_plan = ActivePlan(goal, tuple(plan))
         return PlanDecision(
@@ -209,6 +279,21 @@ class Planner:
                 images.append(str(data_url))
         return self._recent_events_text(), images
 
+    def _untried_actions(
+        self, current: EngineState, actions: list[GameAction]
+    ) -> list[GameAction]:
+        if self.memory is None:
+            return list(actions)
+        noops = self.memory.noop_actions(current)
+        return [action for action in actions if action not in noops]
+
+    def _recent_actions(self, limit: int = 5) -> tuple[str, ...]:
+        if self.memory is None:
+            return ()
+        return tuple(
+            record.action.name for record in self.memory.recent_transitions(limit)
+        )
+
     def _recent_events_text(self) -> str:
         if self.memory is None:
             return ""
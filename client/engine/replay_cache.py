@@ -0,0 +1,67 @@
+"""Persistent record of actions that solved a level, for replaying reruns."""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import sqlite3
+from pathlib import Path
+
+from client.arc.types import GameAction
+from client.engine.memory import TransitionRecord
+from client.engine.perception import EngineState
+
+
+class ReplayCache:
+    """SQLite table mapping (game, level, board) to the action that led to a win."""
+
+    def __init__(self, path: str | Path) -> None:
+        self.path = str(path)
+        if self.path != ":memory:":
+            Path(self.path).parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(self.path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS replay ("
+            "game TEXT NOT NULL, level INTEGER NOT NULL, board_sha TEXT NOT NULL, "
+            "action TEXT NOT NULL, PRIMARY KEY (game, level, board_sha))"
+        )
+        self._conn.commit()
+
+    @staticmethod
+    def board_sha(state: EngineState) -> str:
+        return hashlib.sha256(json.dumps(state.grid).encode("utf-8")).hexdigest()
+
+    def action_for(self, state: EngineState) -> GameAction | None:
+        row = self._conn.execute(
+            "SELECT action FROM replay WHERE game = ? AND level = ? AND board_sha = ?",
+            (state.game_id, state.levels_completed, self.board_sha(state)),
+        ).fetchone()
+        return None if row is None else GameAction[str(row[0])]
+
+    def record_solution(self, transitions: list[TransitionRecord]) -> int:
+        """Store the last action taken from each board of a solving run.
+
+        The last visit to a board is always followed by a loop-free path to the
+        win, so replaying those actions from the level start walks straight to
+        the solution. Returns how many boards were recorded.
+        """
+        rows = {
+            (
+                record.before.game_id,
+                record.before.levels_completed,
+                self.board_sha(record.before),
+            ): record.action.name
+            for record in transitions
+        }
+        self._conn.executemany(
+            "INSERT OR REPLACE INTO replay (game, level, board_sha, action) "
+            "VALUES (?, ?, ?, ?)",
+            [(*key, action) for key, action in rows.items()],
+        )
+        self._conn.commit()
+        return len(rows)
+
+    def close(self) -> None:
+        self._conn.close()
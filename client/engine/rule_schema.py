@@ -7,7 +7,7 @@ from client.engine.perception import EngineState
 from client.arc.types import GameAction, GameState
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class CellCondition:
     dx: int
     dy: int
@@ -25,7 +25,7 @@ class CellCondition:
         return state.cell(anchor_x + self.dx, anchor_y + self.dy) == self.value
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class CellEffect:
     dx: int
     dy: int
@@ -40,7 +40,7 @@ class CellEffect:
         return {"dx": self.dx, "dy": self.dy, "value": self.value}
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class GeneralizedRule:
     id: str
     action: str
@@ -17,6 +17,10 @@ class Rulebook:
         self.json_path = self.base_path / "rules.json"
         self.generalized_rules: list[GeneralizedRule] = []
         self._next_id = 1
+        self._known_rules_text: str | None = None
+        # Bumped whenever rules are added or revised, i.e. whenever predict()
+        # may answer differently. Hit/contradiction bookkeeping does not count.
+        self.revision = 0
         if load_existing:
             self._load()
         if not self.json_path.exists():
@@ -29,6 +33,7 @@ class Rulebook:
         if existing_by_id is not None:
             prepared = prepared.revised_from(existing_by_id)
             self._replace_rule(existing_by_id.id, prepared)
+            self.revision += 1
             self._save()
             return prepared
 
@@ -41,6 +46,7 @@ class Rulebook:
             return merged
 
         self.generalized_rules.append(prepared)
+        self.revision += 1
         self._save()
         return prepared
 
@@ -98,11 +104,14 @@ class Rulebook:
             self._save()
 
     def known_rules_text(self) -> str:
-        return "\n".join(
-            f"- {rule.summary}"
-            for rule in self.generalized_rules
-            if rule.summary.strip()
-        )
+        # Every rule mutation goes through _save, which drops this cache.
+        if self._known_rules_text is None:
+            self._known_rules_text = "\n".join(
+                f"- {rule.summary}"
+                for rule in self.generalized_rules
+                if rule.summary.strip()
+            )
+        return self._known_rules_text
 
     def _prediction_candidates(
         self, before: EngineState, action: GameAction
@@ -169,8 +178,11 @@ class Rulebook:
         self._next_id = int(
             data.get("next_id", len(self.generalized_rules) + 1)
         )
+        self._known_rules_text = None
+        self.revision += 1
 
     def _save(self) -> None:
+        self._known_rules_text = None
         self.base_path.mkdir(parents=True, exist_ok=True)
         self.json_path.write_text(
             json.dumps(
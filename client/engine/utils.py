@@ -1,9 +1,11 @@
 """Utility helpers shared across learning and solving pipelines."""
 
+import re
 from typing import Any, List
 
 
 GRID_SYMBOLS = "0123456789abcdefghijklmnopqrstuvwxyz"
+_BOARD_ROW = re.compile(r"\d+(?: \d+)+")
 
 
 def _normalize_grid(grid: Any) -> List[List[int]]:
@@ -54,3 +56,52 @@ def extract_json(text: str) -> str:
     elif cleaned.startswith("```") and cleaned.endswith("```"):
         cleaned = cleaned[3:-3]
     return cleaned.strip()
+
+
+def json_object_end(text: str) -> int | None:
+    """Return the index just past the first complete top-level JSON object."""
+    depth = 0
+    in_string = escaped = False
+    for index, char in enumerate(text):
+        if in_string:
+            if escaped:
+                escaped = False
+            elif char == "\\":
+                escaped = True
+            elif char == '"':
+                in_string = False
+        elif char == '"':
+            in_string = depth > 0
+        elif char == "{":
+            depth += 1
+        elif char == "}" and depth:
+            depth -= 1
+            if depth == 0:
+                return index + 1
+    return None
+
+
+def compact_board_rows(text: str) -> str:
+    """Drop cell separators from space-separated board rows of single digits.
+
+    Rows are handled per contiguous block, so a board containing any
+    multi-digit value keeps its spaces rather than being half compacted.
+    """
+    lines: list[str] = []
+    block: list[str] = []
+
+    def flush() -> None:
+        if all(len(cell) == 1 for row in block for cell in row.split(" ")):
+            lines.extend(row.replace(" ", "") for row in block)
+        else:
+            lines.extend(block)
+        block.clear()
+
+    for line in text.split("\n"):
+        if _BOARD_ROW.fullmatch(line):
+            block.append(line)
+            continue
+        flush()
+        lines.append(line)
+    flush()
+    return "\n".join(lines)
@@ -1,10 +1,13 @@
+import logging
 import sys
 from argparse import ArgumentParser
+from dataclasses import replace
 from pathlib import Path
 
 if __package__ in {None, ""}:
     sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
 
+from client.engine.agent import run_solving_sessions
 from client.engine.architecture import EngineArchitecture
 from client.engine.llm_client import Config, LlmClient
 from client.arc.arcade_env import ArcadeEnv
@@ -12,26 +15,164 @@ from client.runtime.runner import RuleReasoningLoop
 from client.screen_dashboard import ScreenDashboard
 
 
+def _parse_purpose_pairs(
+    parser: ArgumentParser, flag: str, values: list[str], convert=str
+) -> dict:
+    pairs: dict = {}
+    for value in values:
+        purpose, separator, setting = value.partition("=")
+        if not separator or not purpose.strip() or not setting.strip():
+            parser.error(f"{flag} expects PURPOSE=VALUE, got {value!r}")
+        try:
+            pairs[purpose.strip()] = convert(setting.strip())
+        except ValueError:
+            parser.error(f"{flag} got an invalid value in {value!r}")
+    return pairs
+
+
+def _run_sessions(
+    cfg: Config, game_ids: list[str], backend_url: str, parallel: int
+) -> None:
+    """Solve several games at once without a dashboard over one LLM client."""
+    run_solving_sessions(
+        [replace(cfg, game=game_id) for game_id in game_ids],
+        lambda session: ArcadeEnv(game_id=session.game, backend_url=backend_url),
+        LlmClient(cfg),
+        max_workers=parallel,
+    )
+
+
 def main():
     parser = ArgumentParser(description="AI Agent for ARC-compatible environments")
-    parser.add_argument("--game-id", type=str, default="ps_sokoban_basic-v1")
+    parser.add_argument(
+        "--game-id",
+        type=str,
+        action="append",
+        help="Game to solve; repeat to solve several games at once without the dashboard.",
+    )
+    parser.add_argument(
+        "--parallel",
+        type=int,
+        default=0,
+        help="Games solved concurrently when several --game-id values are given; 0 runs all.",
+    )
     parser.add_argument("--backend-url", type=str, default="http://localhost:8000")
     parser.add_argument("--max_steps", type=int, default=50)
+    parser.add_argument(
+        "--cache-path",
+        type=str,
+        default="",
+        help="SQLite file for replaying identical LLM requests across runs.",
+    )
+    parser.add_argument(
+        "--replay-path",
+        type=str,
+        default="",
+        help="SQLite file of solved-level actions to replay on reruns.",
+    )
+    parser.add_argument(
+        "--similar-board-threshold",
+        type=float,
+        default=0.0,
+        help="Reuse a subgoal/action answer for boards matching this fraction of cells; 0 disables.",
+    )
+    parser.add_argument(
+        "--temperature",
+        type=float,
+        default=None,
+        help="Sampling temperature; 0 also reuses answers to repeated requests.",
+    )
+    parser.add_argument(
+        "--rate-limit-qps",
+        type=float,
+        default=1.0,
+        help="Maximum env actions per second; 0 disables pacing.",
+    )
+    parser.add_argument(
+        "--llm-max-retries",
+        type=int,
+        default=4,
+        help="Retries with backoff for transient OpenRouter errors (429, 5xx, timeouts).",
+    )
+    parser.add_argument(
+        "--prompt-caching",
+        action="store_true",
+        help="Mark system prompts as cacheable prefixes for providers that need it.",
+    )
+    parser.add_argument(
+        "--compact-boards",
+        action="store_true",
+        help="Send single-digit boards to the LLM without cell separators.",
+    )
+    parser.add_argument(
+        "--stream-responses",
+        action="store_true",
+        help="Stream completions and stop reading JSON answers once the object closes.",
+    )
+    parser.add_argument(
+        "--structured-outputs",
+        action="store_true",
+        help="Constrain subgoal/action answers with a JSON schema of action names.",
+    )
+    parser.add_argument(
+        "--purpose-model",
+        action="append",
+        default=[],
+        metavar="PURPOSE=MODEL",
+        help='Route one call purpose to another model, e.g. "subgoal/action=openai/gpt-5-nano".',
+    )
+    parser.add_argument(
+        "--purpose-max-tokens",
+        action="append",
+        default=[],
+        metavar="PURPOSE=TOKENS",
+        help='Cap completion tokens for one call purpose, e.g. "subgoal/action=300".',
+    )
+    parser.add_argument(
+        "--log-level",
+        type=str.upper,
+        default="WARNING",
+        choices=["DEBUG", "INFO", "WARNING", "ERROR"],
+        help="Level for client log messages on stderr; DEBUG adds LLM latencies.",
+    )
     args = parser.parse_args()
+    logging.basicConfig(level=args.log_level, format="%(name)s: %(message)s")
+
+    game_ids = list(dict.fromkeys(args.game_id or ["ps_sokoban_basic-v1"]))
 
     cfg = Config(
-        game=args.game_id,
+        game=game_ids[0],
         max_steps=args.max_steps,
         server_url=args.backend_url,
+        cache_path=args.cache_path,
+        replay_path=args.replay_path,
+        similar_board_threshold=args.similar_board_threshold,
+        temperature=args.temperature,
+        rate_limit_qps=args.rate_limit_qps,
+        llm_max_retries=args.llm_max_retries,
+        prompt_caching=args.prompt_caching,
+        compact_boards=args.compact_boards,
+        stream_responses=args.stream_responses,
+        structured_outputs=args.structured_outputs,
+        purpose_models=_parse_purpose_pairs(
+            parser, "--purpose-model", args.purpose_model
+        ),
+        purpose_max_tokens=_parse_purpose_pairs(
+            parser, "--purpose-max-tokens", args.purpose_max_tokens, int
+        ),
     )
+    if len(game_ids) > 1:
+        _run_sessions(cfg, game_ids, args.backend_url, args.parallel)
+        return
+
     dashboard = ScreenDashboard(
-        game_id=args.game_id,
+        game_id=cfg.game,
         mode="RUN",
         controls="Engine dashboard. Close the window or press Ctrl+C to stop.",
     )
     event_sink = dashboard.push_event
     env = ArcadeEnv(
-        game_id=args.game_id,
+        game_id=cfg.game,
         backend_url=args.backend_url,
         renderer=dashboard.render,
     )
@@ -48,6 +189,7 @@ def main():
         engine.inducer,
         dashboard=dashboard,
         event_sink=event_sink,
+        rate_limit_qps=cfg.rate_limit_qps,
     )
 
     def run_engine() -> None:
@@ -57,6 +199,7 @@ def main():
         dashboard.run_engine(run_engine)
     finally:
         dashboard.close()
+        env.close()
 
 
 if __name__ == "__main__":
@@ -1,6 +1,8 @@
 from __future__ import annotations
 
+import logging
 import time
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from typing import Callable, Optional
 
@@ -11,6 +13,8 @@ from client.engine.planner import PlanDecision
 from client.engine.rulebook import Rulebook
 from client.engine.perception import EngineState
 
+log = logging.getLogger(__name__)
+
 
 @dataclass(frozen=True)
 class StepOutcome:
@@ -51,8 +55,49 @@ class ActionExecutor:
         )
 
 
+class ActionRateLimiter:
+    """Token bucket pacing env actions to at most ``qps`` per second.
+
+    After idle time up to one second's worth of actions may go out back to
+    back. A ``qps`` of 0 or less disables pacing.
+    """
+
+    def __init__(
+        self,
+        qps: float,
+        *,
+        clock_fn: Callable[[], float] = time.monotonic,
+        sleep_fn: Callable[[float], None] = time.sleep,
+    ) -> None:
+        self.qps = float(qps)
+        self.burst = max(1.0, self.qps)
+        self.clock_fn = clock_fn
+        self.sleep_fn = sleep_fn
+        self._tokens = self.burst
+        self._updated: float | None = None
+
+    def acquire(self) -> None:
+        if self.qps <= 0:
+            return
+        now = self.clock_fn()
+        if self._updated is not None:
+            elapsed = now - self._updated
+            self._tokens = min(self.burst, self._tokens + elapsed * self.qps)
+        self._updated = now
+        if self._tokens < 1:
+            wait = (1 - self._tokens) / self.qps
+            self.sleep_fn(wait)
+            self._updated = now + wait
+            self._tokens = 1.0
+        self._tokens -= 1
+
+    def skip_wait(self) -> None:
+        """Let the next ``acquire`` go through without sleeping."""
+        self._tokens = max(self._tokens, 1.0)
+
+
 def emit(message: str, event_sink: Optional[Callable[[str], None]] = None) -> None:
-    (event_sink or print)(message)
+    (event_sink or log.info)(message)
 
 
 def set_dashboard(
@@ -103,6 +148,8 @@ class RuleReasoningLoop:
         dashboard=None,
         event_sink: Optional[Callable[[str], None]] = None,
         sleep_fn: Callable[[float], None] = time.sleep,
+        clock_fn: Callable[[], float] = time.monotonic,
+        rate_limit_qps: float = 1.0,
     ) -> None:
         self.env = env
         self.perceiver = perceiver
@@ -114,6 +161,12 @@ class RuleReasoningLoop:
         self.dashboard = dashboard
         self.event_sink = event_sink
         self.sleep_fn = sleep_fn
+        self.throttle = ActionRateLimiter(
+            rate_limit_qps, clock_fn=clock_fn, sleep_fn=sleep_fn
+        )
+        # Transitions induction has already run on; marked only once
+        # propose_from_memory returns, so a failed call is retried.
+        self._induced: set[tuple[EngineState, GameAction, EngineState]] = set()
 
     def run(
         self,
@@ -130,7 +183,6 @@ class RuleReasoningLoop:
         current_state = self.perceiver.perceive(frame_data)
         self.memory.append_state(current_state)
         actual_game_id = game_id or current_state.game_id
-        steps = unchanged = 0
         emit(
             f"Started session {getattr(self.env, 'session_id', 'unknown')} in unified rule loop",
             self.event_sink,
@@ -142,12 +194,37 @@ class RuleReasoningLoop:
             detail="Evidence store ready.",
         )
 
+        with ThreadPoolExecutor(max_workers=1) as step_pool:
+            self._run_steps(
+                step_pool,
+                frame_data,
+                current_state,
+                max_steps=max_steps,
+                actual_game_id=actual_game_id,
+            )
+
+    def _run_steps(
+        self,
+        step_pool: ThreadPoolExecutor,
+        frame_data: FrameData,
+        current_state: EngineState,
+        *,
+        max_steps: int,
+        actual_game_id: str,
+    ) -> None:
+        steps = unchanged = 0
         while True:
             if steps >= max_steps:
                 emit("Max steps reached.", self.event_sink)
                 return
 
             decision = self.planner.choose_action()
+            self.throttle.acquire()
+            # The environment round-trip and rule prediction only depend on the
+            # chosen action, so overlap them and join before recording.
+            pending_step = step_pool.submit(
+                self.action_executor.execute, frame_data, current_state, decision
+            )
             predictions = self.rulebook.predict(current_state, decision.action)
             emit(
                 format_action_event(
@@ -159,10 +236,12 @@ class RuleReasoningLoop:
                 ),
                 self.event_sink,
             )
+            if len(predictions) == 1:
+                # Search ahead from the expected board instead of idling on
+                # the env round-trip.
+                self.planner.speculate(current_state, predictions[0])
 
-            outcome = self.action_executor.execute(
-                frame_data, current_state, decision
-            )
+            outcome = pending_step.result()
             self._record_outcome(outcome, predictions)
             unexplained = not predictions or outcome.after_state not in predictions
             if unexplained:
@@ -187,7 +266,6 @@ class RuleReasoningLoop:
                         self.dashboard,
                         detail="Board reset after repeated unchanged moves.",
                     )
-                self.sleep_fn(1)
                 continue
 
             unchanged = 0
@@ -198,6 +276,10 @@ class RuleReasoningLoop:
                 != outcome.before_frame.levels_completed
             ):
                 emit("Level complete!", self.event_sink)
+                if outcome.after_frame.state != GameState.GAME_OVER:
+                    self.planner.remember_solved_level()
+                    # A fresh level's first move needs no cooldown.
+                    self.throttle.skip_wait()
                 if outcome.after_frame.state == GameState.WIN:
                     emit("World completed successfully!", self.event_sink)
                     return
@@ -211,8 +293,6 @@ class RuleReasoningLoop:
                         detail="Board reset after GAME_OVER.",
                     )
 
-            self.sleep_fn(1)
-
     def run_learning(
         self,
         *,
@@ -241,6 +321,15 @@ class RuleReasoningLoop:
         recent = self.memory.recent(1)
         if not recent:
             return
+        transition = (recent[0].before, recent[0].action, recent[0].after)
+        if transition in self._induced:
+            # Induction already saw this exact transition; asking again
+            # cannot surface anything new.
+            emit(
+                "Transition already observed, skipping rule induction.",
+                self.event_sink,
+            )
+            return
         try:
             rule_ids = self.inducer.propose_from_memory(game_id, self.memory)
         except RuntimeError as e:
@@ -249,5 +338,6 @@ class RuleReasoningLoop:
         except AssertionError as e:
             emit(f"Rule induction unavailable, skipping: {e}", self.event_sink)
             return
+        self._induced.add(transition)
         if rule_ids:
             emit(f"Proposed {len(rule_ids)} logical rules.", self.event_sink)
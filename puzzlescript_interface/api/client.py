@@ -3,28 +3,58 @@ from typing import Any
 
 from fastapi import HTTPException
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 
 REQUEST_TIMEOUT = 30
 
 
 class PuzzleScriptClient:
-    def __init__(self, base_url: str | None = None) -> None:
+    def __init__(
+        self, base_url: str | None = None, http_session: requests.Session | None = None
+    ) -> None:
         self.base_url = (
             base_url or os.getenv("PUZZLESCRIPT_SERVER_URL", "http://localhost:3543")
         ).rstrip("/")
+        self._urls = {
+            path: f"{self.base_url}{path}" for path in ("/init", "/action", "/observe")
+        }
+        self._session = http_session or self._pooled_session()
+
+    @staticmethod
+    def _pooled_session() -> requests.Session:
+        # Keep connections to the PuzzleScript server alive between calls
+        # instead of reconnecting for every action.
+        session = requests.Session()
+        # Connection failures are retried for every method because the
+        # request never reached the server. Gateway errors are only retried
+        # for GET: a POST /action may already have been applied.
+        retries = Retry(
+            total=3,
+            read=0,
+            other=0,
+            backoff_factor=0.3,
+            status_forcelist=(502, 503, 504),
+            allowed_methods=frozenset({"GET"}),
+            raise_on_status=False,
+        )
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=4, max_retries=retries)
+        session.mount("http://", adapter)
+        session.mount("https://", adapter)
+        return session
 
     def _request(
         self, method: str, path: str, payload: dict[str, Any] | None = None
     ) -> dict[str, Any]:
-        url = f"{self.base_url}{path}"
+        url = self._urls.get(path) or f"{self.base_url}{path}"
         try:
             if method.upper() == "GET":
-                response = requests.request(
+                response = self._session.request(
                     method, url, params=payload, timeout=REQUEST_TIMEOUT
                 )
             else:
-                response = requests.request(
+                response = self._session.request(
                     method, url, json=payload, timeout=REQUEST_TIMEOUT
                 )
         except requests.RequestException as exc:
@@ -119,12 +119,15 @@ def collect_game_evidence(
         api_key=args.api_key,
     )
     steps = 0 if evidence_mode == "one_frame" else args.steps
-    result = collect_random_trajectory(
-        env,
-        rng,
-        steps=steps,
-        evidence_mode=evidence_mode,
-    )
+    try:
+        result = collect_random_trajectory(
+            env,
+            rng,
+            steps=steps,
+            evidence_mode=evidence_mode,
+        )
+    finally:
+        env.close()
     trajectory_name = frame_path_name(game_id)
     trajectory_path = paths.trajectories / game_id / evidence_mode / trajectory_name
     write_json(
@@ -11,7 +11,12 @@ ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", ".."))
 if ROOT not in sys.path:
     sys.path.insert(0, ROOT)
 
-from client.engine.agent import Agent, run_learning_loop, run_solving_loop
+from client.engine.agent import (
+    Agent,
+    run_learning_loop,
+    run_solving_loop,
+    run_solving_sessions,
+)
 from client.engine.llm_client import Config
 from client.arc.types import ActionInput, FrameData, GameAction, GameState
 
@@ -90,6 +95,7 @@ class FakeLlmClient:
         prompt: str,
         image_data_urls: list[str] | None = None,
         purpose: str = "",
+        validate=None,
     ) -> dict:
         return json.loads(
             self._call(
@@ -212,6 +218,56 @@ class AgentLoopTests(unittest.TestCase):
             any(event.startswith("Expected observation:") for event in events)
         )
 
+    def test_solving_sessions_prefix_events_and_close_their_envs(self) -> None:
+        class PurposeLlm:
+            def call_json(
+                self,
+                system: str,
+                prompt: str,
+                image_data_urls: list[str] | None = None,
+                purpose: str = "",
+                validate=None,
+            ) -> dict:
+                if purpose == "subgoal/action":
+                    return {"subgoal": "try it", "plan": ["ACTION1"]}
+                return {"rules": []}
+
+        class ClosingEnv(FakeEnv):
+            def close(self) -> None:
+                closed.append(self.session_id)
+
+        closed: list[str] = []
+        events: list[str] = []
+        rules_dir = tempfile.mkdtemp()
+        configs = [
+            Config(
+                openrouter_api_key="test-openrouter-key",
+                game=game,
+                max_steps=1,
+                mode="solve",
+                rules_dir=rules_dir,
+                rate_limit_qps=0,
+            )
+            for game in ("ps_game_a-v1", "ps_game_b-v1")
+        ]
+
+        def make_env(cfg: Config) -> ClosingEnv:
+            return ClosingEnv(
+                reset_frames=[_frame()],
+                step_frames=[_frame(action=GameAction.ACTION1)],
+                session_id=cfg.game,
+            )
+
+        run_solving_sessions(
+            configs, make_env, PurposeLlm(), event_sink=events.append, max_workers=2
+        )
+
+        self.assertEqual(sorted(closed), ["ps_game_a-v1", "ps_game_b-v1"])
+        self.assertIn("[ps_game_a-v1] Max steps reached.", events)
+        self.assertIn("[ps_game_b-v1] Max steps reached.", events)
+        prefixes = ("[ps_game_a-v1] ", "[ps_game_b-v1] ")
+        self.assertTrue(all(event.startswith(prefixes) for event in events))
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -248,6 +248,50 @@ class ArcadeEnvTests(unittest.TestCase):
             any(url.endswith("/api/cmd/RESET") for _method, url, _kwargs in session.requests)
         )
 
+    def test_local_backend_sends_compact_json_body(self) -> None:
+        session = FakeHttpSession()
+        env = ArcadeEnv(
+            game_id="ps_sokoban_basic-v1",
+            backend_url="http://127.0.0.1:8601",
+            api_key="local-dev",
+            http_session=session,
+        )
+
+        env.reset()
+
+        _method, _url, kwargs = session.requests[-1]
+        self.assertEqual(
+            kwargs["data"],
+            b'{"card_id":"card-1","game_id":"ps_sokoban_basic-v1"}',
+        )
+        self.assertEqual(kwargs["headers"]["Content-Type"], "application/json")
+        self.assertNotIn("json", kwargs)
+
+    def test_default_http_session_only_retries_unapplied_requests(self) -> None:
+        from client.arc.arcade_env import _retrying_session
+
+        adapter = _retrying_session().get_adapter("http://127.0.0.1:8601")
+        retries = adapter.max_retries
+
+        self.assertEqual(retries.total, 3)
+        self.assertEqual(retries.read, 0)
+        self.assertEqual(retries.other, 0)
+        self.assertEqual(tuple(retries.status_forcelist), (429,))
+        self.assertGreater(retries.backoff_jitter, 0)
+        self.assertEqual(adapter._pool_maxsize, 4)
+
+    def test_close_leaves_injected_http_session_open(self) -> None:
+        session = FakeHttpSession()
+        session.close = lambda: self.fail("injected session was closed")
+        env = ArcadeEnv(
+            game_id="ps_sokoban_basic-v1",
+            backend_url="http://127.0.0.1:8601",
+            api_key="local-dev",
+            http_session=session,
+        )
+
+        env.close()
+
 
 if __name__ == "__main__":
     unittest.main()
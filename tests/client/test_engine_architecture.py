@@ -86,6 +86,7 @@ class FakeLlmClient:
         prompt: str,
         image_data_urls: list[str] | None = None,
         purpose: str = "",
+        validate=None,
     ) -> dict:
         return json.loads(
             self._call(
@@ -109,6 +110,7 @@ class FakeImageLlmClient:
         prompt: str,
         image_data_urls: list[str] | None = None,
         purpose: str = "",
+        validate=None,
     ) -> dict:
         self.calls.append(
             {
@@ -150,6 +152,42 @@ class EngineArchitectureTests(unittest.TestCase):
             self.assertIn('"before_id": "S000001"', text)
             self.assertIn('"after_id": "S000002"', text)
 
+    def test_reloaded_memory_resolves_transitions_and_continues_ids(self) -> None:
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = Path(tmpdir) / "timeline.jsonl"
+            perception = Perception()
+            left = perception.perceive(_frame([[2, 0]]))
+            right = perception.perceive(_frame([[0, 2]], action=GameAction.ACTION4))
+            memory = EngineMemory(path)
+            memory.append_initial_state(left)
+            first = memory.append_action_result(GameAction.ACTION4, right)
+
+            reloaded = EngineMemory(path)
+            second = reloaded.append_action_result(GameAction.ACTION3, left)
+
+            self.assertEqual(reloaded.transition_by_id("T000001"), first)
+            self.assertEqual(reloaded.transition_by_id(second.id), second)
+            self.assertEqual(second.id, "T000002")
+            self.assertEqual(reloaded.current_state(), left)
+            self.assertIsNone(reloaded.transition_by_id("T999999"))
+            self.assertEqual(reloaded.action_count(left, GameAction.ACTION4), 1)
+            self.assertEqual(reloaded.action_count(right, GameAction.ACTION4), 0)
+            self.assertEqual(reloaded.global_action_count(GameAction.ACTION3), 1)
+            self.assertIs(reloaded.current_state().grid, reloaded.timeline[0].state.grid)
+
+    def test_state_equality_and_hash_ignore_available_actions(self) -> None:
+        perception = Perception()
+        plain = perception.perceive(_frame([[2, 0]]))
+        same = perception.perceive(_frame([[2, 0]], available_actions=[GameAction.ACTION4]))
+        moved = perception.perceive(_frame([[0, 2]]))
+
+        self.assertEqual(plain, same)
+        self.assertEqual(plain.fingerprint, same.fingerprint)
+        self.assertEqual({plain: "seen"}[same], "seen")
+        self.assertNotEqual(plain, moved)
+        plain.rows().append("scratch")
+        self.assertEqual(plain.rows(), ["2 0"])
+
     def test_rulebook_records_rule_prediction_statistics_without_status_labels(self) -> None:
         with tempfile.TemporaryDirectory() as tmpdir:
             perception = Perception()
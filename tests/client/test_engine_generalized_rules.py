@@ -257,6 +257,27 @@ class EngineGeneralizedRuleTests(unittest.TestCase):
 
             self.assertEqual(text, "- ACTION4 moves the player right.")
 
+    def test_known_rules_text_is_refreshed_when_rules_change(self) -> None:
+        with tempfile.TemporaryDirectory() as tmpdir:
+            rulebook = Rulebook(Path(tmpdir))
+            self.assertEqual(rulebook.known_rules_text(), "")
+
+            rulebook.add_generalized_rule(
+                GeneralizedRule(
+                    id="",
+                    action="ACTION3",
+                    anchor=2,
+                    conditions=(CellCondition(dx=0, dy=0, value=2),),
+                    effects=(CellEffect(dx=0, dy=0, value=0),),
+                    evidence_ids=("T000001",),
+                    summary="ACTION3 moves the player left.",
+                )
+            )
+
+            self.assertEqual(
+                rulebook.known_rules_text(), "- ACTION3 moves the player left."
+            )
+
     def test_planner_uses_generalized_rules_before_llm_probe(self) -> None:
         with tempfile.TemporaryDirectory() as tmpdir:
             memory = EngineMemory(Path(tmpdir) / "timeline.jsonl")
@@ -7,7 +7,12 @@ ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", ".."))
 if ROOT not in sys.path:
     sys.path.insert(0, ROOT)
 
-from client.engine.utils import format_frames, last_grid  # type: ignore[import-not-found]
+from client.engine.utils import (  # type: ignore[import-not-found]
+    compact_board_rows,
+    format_frames,
+    json_object_end,
+    last_grid,
+)
 
 
 class EngineUtilsTests(unittest.TestCase):
@@ -32,6 +37,20 @@ class EngineUtilsTests(unittest.TestCase):
         self.assertIn("23", formatted)
         self.assertIn("32", formatted)
 
+    def test_json_object_end_ignores_braces_inside_strings(self) -> None:
+        text = '```json\n{"summary": "a } b", "nested": {"x": 1}} trailing'
+
+        self.assertTrue(text[: json_object_end(text)].endswith('{"x": 1}}'))
+        self.assertIsNone(json_object_end('{"plan": ["ACTION1"'))
+
+    def test_compact_board_rows_keeps_boards_with_multi_digit_values(self) -> None:
+        text = "Before:\n2 0\n0 1\nAfter:\n10 0\n0 1\nAction: ACTION4 1"
+
+        self.assertEqual(
+            compact_board_rows(text),
+            "Before:\n20\n01\nAfter:\n10 0\n0 1\nAction: ACTION4 1",
+        )
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -91,6 +91,9 @@ class ClientEntrypointTests(unittest.TestCase):
             def __init__(self, **kwargs) -> None:
                 captured.update(kwargs)
 
+            def close(self) -> None:
+                captured["env_closed"] = True
+
         class FakeArchitecture:
             perceiver = object()
             memory = object()
@@ -115,8 +118,10 @@ class ClientEntrypointTests(unittest.TestCase):
                 *,
                 dashboard=None,
                 event_sink=None,
+                rate_limit_qps=1.0,
             ) -> None:
                 captured["loop_env"] = env
+                captured["loop_rate_limit_qps"] = rate_limit_qps
                 captured["loop_dashboard"] = dashboard
 
             def run(self, *, max_steps: int, game_id: str) -> None:
@@ -137,8 +142,57 @@ class ClientEntrypointTests(unittest.TestCase):
         self.assertEqual(captured["game_id"], "ps_sokoban_basic-v1")
         self.assertEqual(captured["architecture_game"], "ps_sokoban_basic-v1")
         self.assertEqual(captured["run_engine_called"], True)
+        self.assertTrue(captured["env_closed"])
+        self.assertEqual(captured["loop_rate_limit_qps"], 1.0)
         self.assertEqual(loop_calls, ["run:ps_sokoban_basic-v1:50"])
 
+    def test_run_arc_agent_solves_repeated_game_ids_as_parallel_sessions(self) -> None:
+        from client import run_arc_agent
+
+        created: list[str] = []
+        closed: list[str] = []
+        captured: dict[str, object] = {}
+
+        class FakeArcadeEnv:
+            def __init__(self, *, game_id, **kwargs) -> None:
+                self.game_id = game_id
+                created.append(game_id)
+
+            def close(self) -> None:
+                closed.append(self.game_id)
+
+        def fake_sessions(configs, make_env, llm_client, max_workers=None) -> None:
+            captured["games"] = [cfg.game for cfg in configs]
+            captured["env_games"] = [make_env(cfg).game_id for cfg in configs]
+            captured["llm_client"] = llm_client
+            captured["max_workers"] = max_workers
+
+        shared_client = object()
+        argv = [
+            RUN_AGENT_PATH,
+            "--game-id",
+            "ps_game_a-v1",
+            "--game-id",
+            "ps_game_b-v1",
+            "--parallel",
+            "2",
+        ]
+        with (
+            patch.dict(os.environ, {"OPENROUTER_API_KEY": "test-key"}),
+            patch.object(sys, "argv", argv),
+            patch.object(run_arc_agent, "ScreenDashboard", side_effect=AssertionError),
+            patch.object(run_arc_agent, "ArcadeEnv", FakeArcadeEnv),
+            patch.object(run_arc_agent, "LlmClient", lambda *args, **kwargs: shared_client),
+            patch.object(run_arc_agent, "run_solving_sessions", fake_sessions),
+        ):
+            run_arc_agent.main()
+
+        self.assertEqual(captured["games"], ["ps_game_a-v1", "ps_game_b-v1"])
+        self.assertEqual(captured["env_games"], ["ps_game_a-v1", "ps_game_b-v1"])
+        self.assertIs(captured["llm_client"], shared_client)
+        self.assertEqual(captured["max_workers"], 2)
+        self.assertEqual(created, ["ps_game_a-v1", "ps_game_b-v1"])
+
     def test_play_arc_client_defaults_to_public_sokoban_id(self) -> None:
         from client import play_arc_client
 
@@ -1,6 +1,7 @@
 import unittest
 
 from client.arc.types import GameAction
+from client.engine.board_cache import SimilarBoardCache, grid_similarity
 from client.engine.goal_manager import GoalManager
 from client.engine.perception import EngineState
 
@@ -27,6 +28,7 @@ class FakeLlm:
         prompt: str,
         image_data_urls: list[str] | None = None,
         purpose: str = "",
+        validate=None,
     ) -> dict:
         self.calls.append(
             {
@@ -78,6 +80,90 @@ class GoalManagerTests(unittest.TestCase):
         self.assertIn("Choose the next subgoal and one-action plan", llm.calls[0]["prompt"])
         self.assertIn("Rendered image context is attached.", llm.calls[0]["prompt"])
 
+    def test_rejects_unknown_and_unavailable_actions(self) -> None:
+        manager = GoalManager()
+        offered = [GameAction.ACTION1, GameAction.ACTION4]
+
+        self.assertEqual(
+            manager._parse_action_plan({"plan": [" action1 "]}, offered),
+            [GameAction.ACTION1],
+        )
+        with self.assertRaisesRegex(ValueError, "unknown action"):
+            manager._parse_action_plan({"plan": ["JUMP"]}, offered)
+        with self.assertRaisesRegex(
+            ValueError, "unavailable action ACTION2; available: ACTION1, ACTION4"
+        ):
+            manager._parse_action_plan({"plan": ["ACTION2"]}, offered)
+
+    def test_similar_board_cache_reuses_plan_for_near_identical_board(self) -> None:
+        llm = FakeLlm({"subgoal": "push the box", "plan": ["ACTION4"]})
+        manager = GoalManager(board_cache=SimilarBoardCache(threshold=0.9))
+        board = [[0] * 10 for _ in range(2)]
+        shifted = [row[:] for row in board]
+        shifted[1][9] = 3
+        kwargs = {
+            "llm_client": llm,
+            "actions": [GameAction.ACTION1, GameAction.ACTION4],
+            "recent_events": "",
+            "known_rules_text": "- none",
+            "recent_actions": ("ACTION1",),
+        }
+
+        manager.ask_for_subgoal_action(current=_state(board), **kwargs)
+        goal, plan = manager.ask_for_subgoal_action(current=_state(shifted), **kwargs)
+
+        self.assertEqual(len(llm.calls), 1)
+        self.assertEqual(goal.description, "push the box")
+        self.assertEqual(plan, [GameAction.ACTION4])
+
+    def test_similar_board_cache_misses_when_context_changes(self) -> None:
+        llm = FakeLlm({"subgoal": "push the box", "plan": ["ACTION4"]})
+        manager = GoalManager(board_cache=SimilarBoardCache(threshold=0.9))
+        kwargs = {
+            "llm_client": llm,
+            "current": _state([[2, 0]]),
+            "actions": [GameAction.ACTION1, GameAction.ACTION4],
+            "recent_events": "",
+        }
+
+        manager.ask_for_subgoal_action(known_rules_text="- none", **kwargs)
+        manager.ask_for_subgoal_action(known_rules_text="- moves right", **kwargs)
+
+        self.assertEqual(len(llm.calls), 2)
+
+    def test_similar_board_cache_misses_when_offered_actions_change(self) -> None:
+        llm = FakeLlm({"subgoal": "go around", "plan": ["ACTION1", "ACTION4"]})
+        manager = GoalManager(board_cache=SimilarBoardCache(threshold=0.9))
+        board = [[0] * 10 for _ in range(2)]
+        shifted = [row[:] for row in board]
+        shifted[1][9] = 3
+        kwargs = {
+            "llm_client": llm,
+            "actions": [GameAction.ACTION1],
+            "recent_events": "",
+            "known_rules_text": "- none",
+        }
+
+        manager.ask_for_subgoal_action(
+            current=_state(board),
+            plan_actions=[GameAction.ACTION1, GameAction.ACTION4],
+            **kwargs,
+        )
+        llm.payload = {"subgoal": "go up", "plan": ["ACTION1"]}
+        _goal, plan = manager.ask_for_subgoal_action(
+            current=_state(shifted),
+            plan_actions=[GameAction.ACTION1, GameAction.ACTION3],
+            **kwargs,
+        )
+
+        self.assertEqual(len(llm.calls), 2)
+        self.assertEqual(plan, [GameAction.ACTION1])
+
+    def test_grid_similarity_requires_matching_shape(self) -> None:
+        self.assertEqual(grid_similarity(((1, 2),), ((1, 2),)), 1.0)
+        self.assertEqual(grid_similarity(((1, 2),), ((1, 3),)), 0.5)
+        self.assertEqual(grid_similarity(((1, 2),), ((1, 2, 3),)), 0.0)
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,56 @@
+import os
+import tempfile
+import unittest
+from pathlib import Path
+
+from client.engine.llm_cache import (
+    LlmResponseCache,
+    from_template,
+    id_slots,
+    to_template,
+)
+
+
+class LlmResponseCacheTests(unittest.TestCase):
+    def test_responses_persist_across_connections(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            path = Path(tmp) / "nested" / "llm_cache.sqlite"
+            key = LlmResponseCache.key("model", "system", "prompt")
+
+            cache = LlmResponseCache(path)
+            self.assertIsNone(cache.get(key))
+            cache.set(key, '{"plan": ["ACTION1"]}')
+            cache.close()
+
+            reopened = LlmResponseCache(path)
+            self.assertEqual(reopened.get(key), '{"plan": ["ACTION1"]}')
+            reopened.close()
+            self.assertTrue(os.path.exists(path))
+
+    def test_key_separates_request_parts(self) -> None:
+        self.assertNotEqual(
+            LlmResponseCache.key("model", "ab", "c"),
+            LlmResponseCache.key("model", "a", "bc"),
+        )
+
+    def test_memory_cache_replaces_existing_response(self) -> None:
+        cache = LlmResponseCache(":memory:")
+        cache.set("key", "first")
+        cache.set("key", "second")
+
+        self.assertEqual(cache.get("key"), "second")
+
+    def test_record_ids_round_trip_through_templates(self) -> None:
+        slots = id_slots("S000002 -> S000003", "T000002 from S000002")
+        template = to_template("T000002 moved S000003; see T999999", slots)
+
+        self.assertEqual(slots, ["S000002", "S000003", "T000002"])
+        self.assertEqual(template, "<id:2> moved <id:1>; see T999999")
+        self.assertEqual(
+            from_template(template, ["S000010", "S000011", "T000010"]),
+            "T000010 moved S000011; see T999999",
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,5 +1,7 @@
 import os
+import threading
 import unittest
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import fields
 from types import SimpleNamespace
 from unittest.mock import MagicMock, patch
@@ -40,6 +42,14 @@ class LlmClientConfigTests(unittest.TestCase):
             "anthropic/claude-opus-4.8",
         )
 
+    def test_transient_error_retries_are_passed_to_openai_client(self) -> None:
+        with patch.dict(os.environ, {"OPENROUTER_API_KEY": "test-key"}, clear=True):
+            cfg = Config(llm_max_retries=6)
+        with patch("client.engine.llm_client.OpenAI") as MockOpenAI:
+            LlmClient(cfg)
+
+        self.assertEqual(MockOpenAI.call_args.kwargs["max_retries"], 6)
+
     def test_openrouter_prefix_is_stripped_from_model(self) -> None:
         with patch.dict(os.environ, {"OPENROUTER_API_KEY": "test-key"}, clear=True):
             cfg = Config(model="openrouter/moonshotai/kimi-k2.7-code")
@@ -47,6 +57,108 @@ class LlmClientConfigTests(unittest.TestCase):
 
         self.assertEqual(client._openrouter_model(), "moonshotai/kimi-k2.7-code")
 
+    def test_purpose_models_route_matching_calls_only(self) -> None:
+        response = SimpleNamespace(
+            choices=[SimpleNamespace(message=SimpleNamespace(content="ok"))]
+        )
+        with patch.dict(os.environ, {"OPENROUTER_API_KEY": "test-key"}, clear=True):
+            cfg = Config(
+                purpose_models={"subgoal/action": "openrouter/openai/gpt-5-nano"}
+            )
+            client, mock_client = self._make_client(cfg)
+            mock_client.chat.completions.create.return_value = response
+            client.call_text("system", "prompt", purpose="subgoal/action")
+            routed = mock_client.chat.completions.create.call_args.kwargs["model"]
+            client.call_text("system", "prompt", purpose="rule creation")
+            default = mock_client.chat.completions.create.call_args.kwargs["model"]
+
+        self.assertEqual(routed, "openai/gpt-5-nano")
+        self.assertEqual(default, "anthropic/claude-opus-4.8")
+
+    def test_purpose_max_tokens_caps_only_matching_calls(self) -> None:
+        response = SimpleNamespace(
+            choices=[SimpleNamespace(message=SimpleNamespace(content="ok"))]
+        )
+        with patch.dict(os.environ, {"OPENROUTER_API_KEY": "test-key"}, clear=True):
+            cfg = Config(purpose_max_tokens={"subgoal/action": 300})
+            client, mock_client = self._make_client(cfg)
+            mock_client.chat.completions.create.return_value = response
+            client.call_text("system", "prompt", purpose="subgoal/action")
+            capped = mock_client.chat.completions.create.call_args.kwargs
+            client.call_text("system", "prompt", purpose="rule creation")
+            uncapped = mock_client.chat.completions.create.call_args.kwargs
+
+        self.assertEqual(capped["max_tokens"], 300)
+        self.assertNotIn("max_tokens", uncapped)
+
+    def test_request_options_are_built_once_per_purpose(self) -> None:
+        with patch.dict(os.environ, {"OPENROUTER_API_KEY": "test-key"}, clear=True):
+            client, _ = self._make_client(Config(temperature=0.2))
+
+        first = client._request_kwargs(True, "subgoal/action")
+
+        self.assertIs(client._request_kwargs(True, "subgoal/action"), first)
+        self.assertIsNot(client._request_kwargs(False, "subgoal/action"), first)
+        self.assertEqual(first["temperature"], 0.2)
+        self.assertEqual(first["response_format"], {"type": "json_object"})
+
+    def test_prompt_caching_marks_system_prompt_as_cacheable_prefix(self) -> None:
+        response = SimpleNamespace(
+            choices=[SimpleNamespace(message=SimpleNamespace(content="ok"))]
+        )
+        with patch.dict(os.environ, {"OPENROUTER_API_KEY": "test-key"}, clear=True):
+            client, mock_client = self._make_client(Config(prompt_caching=True))
+            mock_client.chat.completions.create.return_value = response
+            client.call_text("system", "prompt")
+
+        messages = mock_client.chat.completions.create.call_args.kwargs["messages"]
+        self.assertEqual(
+            messages[0]["content"],
+            [{"type": "text", "text": "system", "cache_control": {"type": "ephemeral"}}],
+        )
+        self.assertEqual(messages[1]["content"], "prompt")
+
+    def test_compact_boards_strips_cell_separators_from_prompt(self) -> None:
+        response = SimpleNamespace(
+            choices=[SimpleNamespace(message=SimpleNamespace(content="ok"))]
+        )
+        with patch.dict(os.environ, {"OPENROUTER_API_KEY": "test-key"}, clear=True):
+            client, mock_client = self._make_client(Config(compact_boards=True))
+            mock_client.chat.completions.create.return_value = response
+            client.call_text("system", "Current board:\n2 0 1\n0 0 0")
+            compacted = mock_client.chat.completions.create.call_args.kwargs
+            client.call_text("system", "No board here")
+            untouched = mock_client.chat.completions.create.call_args.kwargs
+
+        self.assertEqual(
+            compacted["messages"][1]["content"],
+            "Current board:\n201\n000\n\nBoards are written one digit per cell.",
+        )
+        self.assertEqual(untouched["messages"][1]["content"], "No board here")
+
+    def test_structured_outputs_send_schema_only_for_known_purposes(self) -> None:
+        response = SimpleNamespace(
+            choices=[
+                SimpleNamespace(
+                    message=SimpleNamespace(
+                        content='{"subgoal": "probe", "plan": ["ACTION1"]}'
+                    )
+                )
+            ]
+        )
+        with patch.dict(os.environ, {"OPENROUTER_API_KEY": "test-key"}, clear=True):
+            client, mock_client = self._make_client(Config(structured_outputs=True))
+            mock_client.chat.completions.create.return_value = response
+            client.call_json("system", "prompt", purpose="subgoal/action")
+            structured = mock_client.chat.completions.create.call_args.kwargs
+            client.call_json("system", "prompt", purpose="rule creation")
+            plain = mock_client.chat.completions.create.call_args.kwargs
+
+        schema = structured["response_format"]["json_schema"]["schema"]
+        self.assertEqual(structured["response_format"]["type"], "json_schema")
+        self.assertNotIn("RESET", schema["properties"]["plan"]["items"]["enum"])
+        self.assertEqual(plain["response_format"], {"type": "json_object"})
+
     def test_openrouter_key_is_required(self) -> None:
         with patch.dict(os.environ, {"UNRELATED_LLM_KEY": "ignored"}, clear=True):
             with self.assertRaisesRegex(ValueError, "OPENROUTER_API_KEY not found"):
@@ -151,6 +263,180 @@ class LlmClientConfigTests(unittest.TestCase):
             with self.assertRaisesRegex(ValueError, "invalid JSON"):
                 client.call_json("system", "prompt")
 
+    def test_cache_path_replays_identical_requests_without_calling_model(self) -> None:
+        events: list[str] = []
+        response = SimpleNamespace(
+            choices=[SimpleNamespace(message=SimpleNamespace(content="ok"))]
+        )
+        with patch.dict(os.environ, {"OPENROUTER_API_KEY": "test-key"}, clear=True):
+            cfg = Config(cache_path=":memory:")
+            client, mock_client = self._make_client(cfg, event_sink=events.append)
+            mock_client.chat.completions.create.return_value = response
+            first = client._call("system", "prompt", purpose="subgoal/action")
+            second = client._call("system", "prompt", purpose="subgoal/action")
+            client._call("system", "prompt", json_mode=True)
+
+        self.assertEqual((first, second), ("ok", "ok"))
+        self.assertEqual(mock_client.chat.completions.create.call_count, 2)
+        self.assertIn(
+            "[anthropic/claude-opus-4.8] Cache hit for subgoal/action",
+            events,
+        )
+
+    def test_zero_temperature_memoizes_identical_requests_in_process(self) -> None:
+        response = SimpleNamespace(
+            choices=[SimpleNamespace(message=SimpleNamespace(content="ok"))]
+        )
+        with patch.dict(os.environ, {"OPENROUTER_API_KEY": "test-key"}, clear=True):
+            client, mock_client = self._make_client(Config(temperature=0))
+            mock_client.chat.completions.create.return_value = response
+            client._call("system", "prompt")
+            client._call("system", "prompt")
+            client._call("system", "other prompt")
+
+        self.assertIsNone(client.cache)
+        self.assertEqual(mock_client.chat.completions.create.call_count, 2)
+        self.assertEqual(
+            mock_client.chat.completions.create.call_args.kwargs["temperature"], 0.0
+        )
+
+    def test_invalid_json_answers_are_not_cached(self) -> None:
+        def reply(content: str) -> SimpleNamespace:
+            return SimpleNamespace(
+                choices=[SimpleNamespace(message=SimpleNamespace(content=content))]
+            )
+
+        def reject(data: dict) -> None:
+            if data.get("plan") == ["JUMP"]:
+                raise ValueError("unknown action")
+
+        with patch.dict(os.environ, {"OPENROUTER_API_KEY": "test-key"}, clear=True):
+            client, mock_client = self._make_client(Config(cache_path=":memory:"))
+            mock_client.chat.completions.create.side_effect = [
+                reply("not json"),
+                reply('{"plan": ["JUMP"]}'),
+                reply('{"plan": ["ACTION1"]}'),
+            ]
+            with self.assertRaises(ValueError):
+                client.call_json("system", "prompt", validate=reject)
+            with self.assertRaises(ValueError):
+                client.call_json("system", "prompt", validate=reject)
+            first = client.call_json("system", "prompt", validate=reject)
+            second = client.call_json("system", "prompt", validate=reject)
+
+        self.assertEqual(first, {"plan": ["ACTION1"]})
+        self.assertEqual(second, first)
+        self.assertEqual(mock_client.chat.completions.create.call_count, 3)
+
+    def test_in_process_memo_evicts_least_recently_used_answers(self) -> None:
+        response = SimpleNamespace(
+            choices=[SimpleNamespace(message=SimpleNamespace(content="ok"))]
+        )
+        with patch.dict(os.environ, {"OPENROUTER_API_KEY": "test-key"}, clear=True):
+            client, mock_client = self._make_client(
+                Config(temperature=0, memo_max_entries=2)
+            )
+            mock_client.chat.completions.create.return_value = response
+            client._call("system", "first")
+            client._call("system", "second")
+            client._call("system", "first")
+            client._call("system", "third")
+            self.assertEqual(mock_client.chat.completions.create.call_count, 3)
+            client._call("system", "first")
+            self.assertEqual(mock_client.chat.completions.create.call_count, 3)
+            client._call("system", "second")
+
+        self.assertEqual(len(client._memo), 2)
+        self.assertEqual(mock_client.chat.completions.create.call_count, 4)
+
+    def test_concurrent_identical_requests_share_one_completion(self) -> None:
+        started = threading.Event()
+        release = threading.Event()
+        response = SimpleNamespace(
+            choices=[SimpleNamespace(message=SimpleNamespace(content="ok"))]
+        )
+
+        def slow_create(**_kwargs):
+            started.set()
+            release.wait(timeout=5)
+            return response
+
+        with patch.dict(os.environ, {"OPENROUTER_API_KEY": "test-key"}, clear=True):
+            client, mock_client = self._make_client(Config(temperature=0))
+            mock_client.chat.completions.create.side_effect = slow_create
+            with ThreadPoolExecutor(max_workers=4) as pool:
+                futures = [
+                    pool.submit(client._call, "system", "prompt") for _ in range(4)
+                ]
+                self.assertTrue(started.wait(timeout=5))
+                release.set()
+                results = [future.result(timeout=5) for future in futures]
+
+        self.assertEqual(results, ["ok"] * 4)
+        self.assertEqual(mock_client.chat.completions.create.call_count, 1)
+
+    def test_cache_reuses_response_when_only_record_ids_differ(self) -> None:
+        response = SimpleNamespace(
+            choices=[
+                SimpleNamespace(
+                    message=SimpleNamespace(content='{"evidence_ids": ["T000001"]}')
+                )
+            ]
+        )
+        with patch.dict(os.environ, {"OPENROUTER_API_KEY": "test-key"}, clear=True):
+            client, mock_client = self._make_client(Config(cache_path=":memory:"))
+            mock_client.chat.completions.create.return_value = response
+            client._call("system", "T000001: ACTION4\nBoard: 2 0")
+            replayed = client._call("system", "T000007: ACTION4\nBoard: 2 0")
+
+        self.assertEqual(replayed, '{"evidence_ids": ["T000007"]}')
+        self.assertEqual(mock_client.chat.completions.create.call_count, 1)
+
+    def test_streamed_json_stops_reading_once_object_is_complete(self) -> None:
+        def chunk(text: str):
+            return SimpleNamespace(
+                choices=[SimpleNamespace(delta=SimpleNamespace(content=text))]
+            )
+
+        stream = MagicMock()
+        stream.__iter__.return_value = iter(
+            [
+                SimpleNamespace(choices=[]),
+                chunk('{"plan": '),
+                chunk('["ACTION1"]}'),
+                chunk(" and an explanation the engine never needs"),
+            ]
+        )
+        with patch.dict(os.environ, {"OPENROUTER_API_KEY": "test-key"}, clear=True):
+            cfg = Config(stream_responses=True)
+            client, mock_client = self._make_client(cfg)
+            mock_client.chat.completions.create.return_value = stream
+            result = client.call_json("system", "prompt")
+
+        self.assertEqual(result, {"plan": ["ACTION1"]})
+        self.assertTrue(
+            mock_client.chat.completions.create.call_args.kwargs["stream"]
+        )
+        stream.close.assert_called_once()
+
+
+    def test_streamed_json_inside_plain_fence_still_parses(self) -> None:
+        stream = MagicMock()
+        stream.__iter__.return_value = iter(
+            [
+                SimpleNamespace(
+                    choices=[SimpleNamespace(delta=SimpleNamespace(content=text))]
+                )
+                for text in ["```\n", '{"plan": ["ACTION2"]}', "\n```"]
+            ]
+        )
+        with patch.dict(os.environ, {"OPENROUTER_API_KEY": "test-key"}, clear=True):
+            client, mock_client = self._make_client(Config(stream_responses=True))
+            mock_client.chat.completions.create.return_value = stream
+            result = client.call_json("system", "prompt")
+
+        self.assertEqual(result, {"plan": ["ACTION2"]})
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -83,6 +83,7 @@ class FakeLlmClient:
         prompt: str,
         image_data_urls: list[str] | None = None,
         purpose: str = "",
+        validate=None,
     ) -> dict:
         return json.loads(
             self._call(
@@ -239,6 +240,157 @@ class ModularEngineLoopTests(unittest.TestCase):
             self.assertIn("choose a small useful subgoal", llm.calls[2][0])
             self.assertIn("propose executable mechanical rules", llm.calls[3][0])
 
+    def test_loop_paces_actions_with_a_token_bucket(self) -> None:
+        from client.runtime.runner import ActionExecutor, RuleReasoningLoop
+        from client.engine.planner import Planner
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            before_frame = _frame([[2, 0, 0]])
+            env = FakeEnv(
+                before_frame,
+                [
+                    _frame([[0, 2, 0]], action=GameAction.ACTION4),
+                    _frame([[0, 0, 2]], action=GameAction.ACTION4),
+                ],
+            )
+            memory = EngineMemory(Path(tmpdir) / "timeline.jsonl")
+            rulebook = Rulebook(Path(tmpdir))
+            llm = FakeLlmClient(
+                [
+                    '{"subgoal": "move right", "plan": ["ACTION4"]}',
+                    '{"subgoal": "keep moving right", "plan": ["ACTION4"]}',
+                ]
+            )
+
+            class Inducer:
+                def propose_from_memory(self, game_name, memory) -> list[str]:
+                    return []
+
+            # The second action is ready 0.25s after the first one went out.
+            ticks = iter([0.0, 0.25])
+            sleeps: list[float] = []
+            loop = RuleReasoningLoop(
+                env,
+                Perception(),
+                memory,
+                rulebook,
+                Planner(rulebook=rulebook, memory=memory, llm_client=llm),
+                Inducer(),
+                ActionExecutor(env, Perception()),
+                sleep_fn=sleeps.append,
+                clock_fn=lambda: next(ticks),
+            )
+
+            loop.run(max_steps=2, game_id="modular-world")
+
+            self.assertEqual(sleeps, [0.75])
+
+    def test_action_rate_limiter_allows_bursts_up_to_one_second_of_actions(
+        self,
+    ) -> None:
+        from client.runtime.runner import ActionRateLimiter
+
+        ticks = iter([0.0, 0.0, 0.0, 5.0])
+        sleeps: list[float] = []
+        limiter = ActionRateLimiter(
+            2.0, clock_fn=lambda: next(ticks), sleep_fn=sleeps.append
+        )
+
+        for _ in range(4):
+            limiter.acquire()
+        ActionRateLimiter(0, clock_fn=self.fail, sleep_fn=self.fail).acquire()
+
+        self.assertEqual(sleeps, [0.5])
+
+    def test_action_rate_limiter_skip_wait_releases_next_action(self) -> None:
+        from client.runtime.runner import ActionRateLimiter
+
+        sleeps: list[float] = []
+        limiter = ActionRateLimiter(1.0, clock_fn=lambda: 0.0, sleep_fn=sleeps.append)
+
+        limiter.acquire()
+        limiter.skip_wait()
+        limiter.acquire()
+        limiter.acquire()
+
+        self.assertEqual(sleeps, [1.0])
+
+    def test_loop_skips_induction_for_an_already_observed_transition(self) -> None:
+        from client.runtime.runner import RuleReasoningLoop
+
+        class CountingInducer:
+            calls = 0
+
+            def propose_from_memory(self, game_name, memory) -> list[str]:
+                self.calls += 1
+                return []
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            perception = Perception()
+            left = perception.perceive(_frame([[2, 0]]))
+            right = perception.perceive(_frame([[0, 2]], action=GameAction.ACTION4))
+            memory = EngineMemory(Path(tmpdir) / "timeline.jsonl")
+            inducer = CountingInducer()
+            events: list[str] = []
+            loop = RuleReasoningLoop(
+                FakeEnv(_frame([[2, 0]]), []),
+                perception,
+                memory,
+                Rulebook(Path(tmpdir)),
+                planner=None,
+                inducer=inducer,
+                event_sink=events.append,
+            )
+
+            memory.append_initial_state(left)
+            memory.append_action_result(GameAction.ACTION4, right)
+            loop._maybe_induce_rules("modular-world")
+            memory.append_state(left)
+            memory.append_action_result(GameAction.ACTION4, right)
+            loop._maybe_induce_rules("modular-world")
+
+            self.assertEqual(inducer.calls, 1)
+            self.assertIn(
+                "Transition already observed, skipping rule induction.", events
+            )
+
+    def test_loop_retries_induction_after_a_failed_attempt(self) -> None:
+        from client.runtime.runner import RuleReasoningLoop
+
+        class FlakyInducer:
+            calls = 0
+
+            def propose_from_memory(self, game_name, memory) -> list[str]:
+                self.calls += 1
+                if self.calls == 1:
+                    raise RuntimeError("LLM unavailable")
+                return []
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            perception = Perception()
+            left = perception.perceive(_frame([[2, 0]]))
+            right = perception.perceive(_frame([[0, 2]], action=GameAction.ACTION4))
+            memory = EngineMemory(Path(tmpdir) / "timeline.jsonl")
+            inducer = FlakyInducer()
+            loop = RuleReasoningLoop(
+                FakeEnv(_frame([[2, 0]]), []),
+                perception,
+                memory,
+                Rulebook(Path(tmpdir)),
+                planner=None,
+                inducer=inducer,
+                event_sink=lambda _message: None,
+            )
+
+            memory.append_initial_state(left)
+            memory.append_action_result(GameAction.ACTION4, right)
+            loop._maybe_induce_rules("modular-world")
+            memory.append_state(left)
+            memory.append_action_result(GameAction.ACTION4, right)
+            loop._maybe_induce_rules("modular-world")
+
+            self.assertEqual(inducer.calls, 2)
+
     def test_runtime_runner_executes_engine_decisions_outside_engine(self) -> None:
         from client.runtime.runner import ActionExecutor
 
@@ -1,10 +1,13 @@
 ﻿import tempfile
 import unittest
 from pathlib import Path
+from unittest.mock import patch
 
 from client.engine.memory import EngineMemory
 from client.engine.perception import EngineState, Perception
 from client.engine.planner import Planner
+from client.engine.replay_cache import ReplayCache
+from client.engine.rule_schema import CellCondition, CellEffect, GeneralizedRule
 from client.engine.rulebook import Rulebook
 from client.arc.types import (
     ActionInput,
@@ -36,6 +39,25 @@ def _frame(
     )
 
 
+def _win_on_right_rule() -> GeneralizedRule:
+    return GeneralizedRule(
+        id="",
+        action="ACTION4",
+        anchor=2,
+        conditions=(
+            CellCondition(dx=0, dy=0, value=2),
+            CellCondition(dx=1, dy=0, value=0),
+        ),
+        effects=(
+            CellEffect(dx=0, dy=0, value=0),
+            CellEffect(dx=1, dy=0, value=2),
+        ),
+        evidence_ids=(),
+        result_state="WIN",
+        summary="ACTION4 moves the player right and wins.",
+    )
+
+
 class FakeLlm:
     def __init__(self, payload: dict) -> None:
         self.payload = payload
@@ -47,6 +69,7 @@ class FakeLlm:
         prompt: str,
         image_data_urls: list[str] | None = None,
         purpose: str = "",
+        validate=None,
     ) -> dict:
         self.calls.append(
             {
@@ -135,6 +158,128 @@ class PlannerFirstArchitectureTests(unittest.TestCase):
             self.assertEqual(planner.game_goal.kind, "game_goal")
             self.assertEqual(planner.active_plan.goal.kind, "subgoal")
 
+    def test_planner_skips_llm_when_one_action_is_left_untried(self) -> None:
+        with tempfile.TemporaryDirectory() as tmpdir:
+            perception = Perception()
+            actions = [GameAction.ACTION3, GameAction.ACTION4]
+            board = perception.perceive(_frame([[1, 2]], available_actions=actions))
+            memory = EngineMemory(Path(tmpdir) / "timeline.jsonl")
+            memory.append_initial_state(board)
+            memory.append_action_result(GameAction.ACTION4, board)
+            llm = FakeLlm({"subgoal": "unused", "plan": ["ACTION4"]})
+            planner = Planner(
+                memory=memory, rulebook=Rulebook(Path(tmpdir)), llm_client=llm
+            )
+
+            decision = planner.choose_action()
+
+            self.assertEqual(decision.action, GameAction.ACTION3)
+            self.assertEqual(decision.reason, "untried_action")
+            self.assertTrue(decision.exploratory)
+            self.assertEqual(llm.calls, [])
+
+    def test_planner_hides_known_noop_actions_from_llm(self) -> None:
+        with tempfile.TemporaryDirectory() as tmpdir:
+            perception = Perception()
+            actions = [GameAction.ACTION1, GameAction.ACTION3, GameAction.ACTION4]
+            board = perception.perceive(_frame([[1, 2]], available_actions=actions))
+            memory = EngineMemory(Path(tmpdir) / "timeline.jsonl")
+            memory.append_initial_state(board)
+            memory.append_action_result(GameAction.ACTION4, board)
+            llm = FakeLlm({"subgoal": "try moving up", "plan": ["ACTION1"]})
+            planner = Planner(
+                memory=memory, rulebook=Rulebook(Path(tmpdir)), llm_client=llm
+            )
+
+            decision = planner.choose_action()
+
+            self.assertEqual(decision.action, GameAction.ACTION1)
+            self.assertIn("Available actions: ACTION1, ACTION3\n", llm.calls[0]["prompt"])
+
+    def test_planner_accepts_known_noop_action_later_in_llm_plan(self) -> None:
+        with tempfile.TemporaryDirectory() as tmpdir:
+            perception = Perception()
+            actions = [GameAction.ACTION1, GameAction.ACTION3, GameAction.ACTION4]
+            board = perception.perceive(_frame([[1, 2]], available_actions=actions))
+            memory = EngineMemory(Path(tmpdir) / "timeline.jsonl")
+            memory.append_initial_state(board)
+            memory.append_action_result(GameAction.ACTION4, board)
+            llm = FakeLlm(
+                {"subgoal": "go up then right", "plan": ["ACTION1", "ACTION4"]}
+            )
+            planner = Planner(
+                memory=memory, rulebook=Rulebook(Path(tmpdir)), llm_client=llm
+            )
+
+            decision = planner.choose_action()
+
+            self.assertEqual(decision.action, GameAction.ACTION1)
+            self.assertEqual(
+                planner.active_plan.actions, (GameAction.ACTION1, GameAction.ACTION4)
+            )
+
+    def test_speculative_plan_is_reused_only_while_rules_are_unchanged(self) -> None:
+        with tempfile.TemporaryDirectory() as tmpdir:
+            perception = Perception()
+            current = perception.perceive(_frame([[2, 0, 0]]))
+            predicted = perception.perceive(_frame([[0, 2, 0]]))
+            rulebook = Rulebook(Path(tmpdir))
+            rulebook.add_generalized_rule(_win_on_right_rule())
+            planner = Planner(rulebook=rulebook)
+            actions = [GameAction.ACTION4]
+
+            planner.speculate(current, predicted)
+            with patch.object(planner, "plan_to_win", side_effect=AssertionError):
+                self.assertEqual(
+                    planner.plan_to_goal(predicted, actions), [GameAction.ACTION4]
+                )
+
+            planner.speculate(current, predicted)
+            rulebook.add_generalized_rule(
+                GeneralizedRule(
+                    id="",
+                    action="ACTION4",
+                    anchor=2,
+                    conditions=(CellCondition(dx=0, dy=0, value=2),),
+                    effects=(CellEffect(dx=0, dy=0, value=2),),
+                    evidence_ids=(),
+                    summary="ACTION4 leaves the player in place.",
+                )
+            )
+            with patch.object(planner, "plan_to_win", return_value=None) as search:
+                self.assertIsNone(planner.plan_to_goal(predicted, actions))
+            search.assert_called_once_with(predicted, actions)
+
+    def test_planner_replays_solved_level_without_asking_llm(self) -> None:
+        with tempfile.TemporaryDirectory() as tmpdir:
+            perception = Perception()
+            actions = [GameAction.ACTION3, GameAction.ACTION4]
+            board = perception.perceive(_frame([[2, 0]], available_actions=actions))
+            solved = perception.perceive(_frame([[0, 2]], available_actions=actions))
+            memory = EngineMemory(Path(tmpdir) / "timeline.jsonl")
+            memory.append_initial_state(board)
+            memory.append_action_result(GameAction.ACTION4, solved)
+            replay = ReplayCache(":memory:")
+            Planner(
+                memory=memory, rulebook=Rulebook(Path(tmpdir)), replay=replay
+            ).remember_solved_level()
+
+            rerun_memory = EngineMemory(Path(tmpdir) / "rerun.jsonl")
+            rerun_memory.append_initial_state(board)
+            llm = FakeLlm({"subgoal": "unused", "plan": ["ACTION3"]})
+            planner = Planner(
+                memory=rerun_memory,
+                rulebook=Rulebook(Path(tmpdir)),
+                llm_client=llm,
+                replay=replay,
+            )
+
+            decision = planner.choose_action()
+
+            self.assertEqual(decision.action, GameAction.ACTION4)
+            self.assertEqual(decision.reason, "replay")
+            self.assertEqual(llm.calls, [])
+
     def test_planner_rejects_missing_available_actions(self) -> None:
         with tempfile.TemporaryDirectory() as tmpdir:
             memory = EngineMemory(Path(tmpdir) / "timeline.jsonl")
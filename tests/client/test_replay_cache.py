@@ -0,0 +1,58 @@
+import tempfile
+import unittest
+from pathlib import Path
+
+from client.arc.types import GameAction, GameState
+from client.engine.memory import EngineMemory, TransitionRecord
+from client.engine.perception import EngineState
+from client.engine.replay_cache import ReplayCache
+
+
+def _state(grid: list[list[int]], *, level: int = 0) -> EngineState:
+    return EngineState(
+        grid=tuple(tuple(row) for row in grid),
+        state=GameState.PLAYING,
+        levels_completed=level,
+        win_levels=2,
+        game_id="replay-world",
+    )
+
+
+class ReplayCacheTests(unittest.TestCase):
+    def test_keeps_the_action_from_the_last_visit_to_each_board(self) -> None:
+        start = _state([[0, 2, 0]])
+        left = _state([[2, 0, 0]])
+        right = _state([[0, 0, 2]])
+        cache = ReplayCache(":memory:")
+
+        recorded = cache.record_solution(
+            [
+                TransitionRecord("T000001", start, GameAction.ACTION3, left),
+                TransitionRecord("T000002", left, GameAction.ACTION4, start),
+                TransitionRecord("T000003", start, GameAction.ACTION4, right),
+            ]
+        )
+
+        self.assertEqual(recorded, 2)
+        self.assertEqual(cache.action_for(start), GameAction.ACTION4)
+        self.assertEqual(cache.action_for(left), GameAction.ACTION4)
+        self.assertIsNone(cache.action_for(right))
+        self.assertIsNone(cache.action_for(_state([[0, 2, 0]], level=1)))
+
+    def test_memory_level_run_stops_at_resets_and_level_changes(self) -> None:
+        with tempfile.TemporaryDirectory() as tmpdir:
+            memory = EngineMemory(Path(tmpdir) / "timeline.jsonl")
+            start, moved = _state([[2, 0]]), _state([[0, 2]])
+            memory.append_initial_state(start)
+            memory.append_action_result(GameAction.ACTION4, moved)
+            memory.append_state(start)
+            second = memory.append_action_result(GameAction.ACTION4, moved)
+            solved = memory.append_action_result(
+                GameAction.ACTION1, _state([[0, 2]], level=1)
+            )
+
+            self.assertEqual(memory.latest_level_run(), [second, solved])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -16,6 +16,7 @@ from studies.goal_recognition.experiment.prompts import (
     PROMPT_ID,
     build_prompt_variants,
 )
+from studies.goal_recognition.experiment import run_collect
 from studies.goal_recognition.experiment.schema import (
     make_run_paths,
     normalize_prediction,
@@ -192,6 +193,42 @@ def test_run_paths_keep_outputs_inside_run_directory(tmp_path: Path) -> None:
     assert paths.skips == paths.run_dir / "skips.jsonl"
 
 
+def test_run_collect_writes_every_job_and_closes_envs(
+    tmp_path: Path, monkeypatch
+) -> None:
+    closed: list[str] = []
+
+    class ClosingEnv(FakeEnv):
+        def __init__(self, game_id: str, **_kwargs) -> None:
+            super().__init__()
+            self.game_id = game_id
+
+        def close(self) -> None:
+            closed.append(self.game_id)
+
+    monkeypatch.setattr(run_collect, "ArcadeEnv", ClosingEnv)
+
+    status = run_collect.main(
+        [
+            "--games",
+            "game-a,game-b",
+            "--out",
+            str(tmp_path),
+            "--run-id",
+            "run-1",
+            "--dry-run",
+        ]
+    )
+
+    paths = make_run_paths(tmp_path, "run-1")
+    assert status == 0
+    assert paths.errors.read_text(encoding="utf-8") == ""
+    assert sorted(closed) == sorted(["game-a", "game-b"] * len(EVIDENCE_MODES))
+    for game_id in ("game-a", "game-b"):
+        for mode in EVIDENCE_MODES:
+            assert list((paths.trajectories / game_id / mode).glob("*.json"))
+
+
 def test_normalize_prediction_defaults_wrong_types() -> None:
     assert normalize_prediction(
         {